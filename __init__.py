@@ -1,40 +1,65 @@
 """ComfyUI-hybs-nodes extension entrypoint."""
 
+import time
+
+_import_start = time.perf_counter()
+
 from .hybs_comfy_api import ComfyExtension, io
+from .hybs_logging import get_logger
+from .hybs_metrics import METRICS, instrument_node, register_routes, startup_timer
 
-print('[HYBS]["Extension"] __init__.py import start')
+METRICS.record_startup("core", time.perf_counter() - _import_start)
+LOGGER = get_logger("Extension")
 
 WEB_DIRECTORY = "./web/js"
 
-# v3 nodes
-from .nodes.hybs_resolution_selector import HYBS_ResolutionSelector
-from .nodes.hybs_random_resolution_selector import HYBS_RandomResolutionSelector
-from .nodes.hybs_seed_list_generator import HYBS_SeedListGenerator
-from .nodes.hybs_conditional_lora_loader import HYBS_ConditionalLoRALoader
-from .nodes.hybs_load_lora import HYBS_LoadLoRA
-from .nodes.hybs_diffusion_model_list import HYBS_DiffusionModelList
-from .nodes.hybs_lora_list import HYBS_LoRAList
-from .nodes.hybs_double_list import HYBS_DoubleList
-from .nodes.hybs_int_list import HYBS_IntList
-from .nodes.hybs_load_image_prompt_metadata import (
-    HYBS_LoadImagePromptMetadata,
-    HYBS_LoadImagePromptMetadataAdvance,
-)
-from .nodes.hybs_group_bypasser_nodes import (
-    HYBS_GroupBypasser_Parent,
-    HYBS_GroupBypasser_Child,
-    HYBS_GroupBypasser_Panel,
-)
+# v3 nodes. Node modules only build schemas at import; torch, numpy, PIL and
+# comfy.* are imported on first execute.
+with startup_timer("hybs_resolution_selector"):
+    from .nodes.hybs_resolution_selector import HYBS_ResolutionSelector
+with startup_timer("hybs_random_resolution_selector"):
+    from .nodes.hybs_random_resolution_selector import HYBS_RandomResolutionSelector
+with startup_timer("hybs_seed_list_generator"):
+    from .nodes.hybs_seed_list_generator import HYBS_SeedListGenerator
+with startup_timer("hybs_conditional_lora_loader"):
+    from .nodes.hybs_conditional_lora_loader import (
+        HYBS_ConditionalLoRALoader,
+        HYBS_ConditionalLoRALoaderList,
+    )
+with startup_timer("hybs_load_lora"):
+    from .nodes.hybs_load_lora import HYBS_LoadLoRA
+with startup_timer("hybs_diffusion_model_list"):
+    from .nodes.hybs_diffusion_model_list import HYBS_DiffusionModelList
+with startup_timer("hybs_lora_list"):
+    from .nodes.hybs_lora_list import HYBS_LoRAList
+with startup_timer("hybs_double_list"):
+    from .nodes.hybs_double_list import HYBS_DoubleList
+with startup_timer("hybs_int_list"):
+    from .nodes.hybs_int_list import HYBS_IntList
+with startup_timer("hybs_load_image_prompt_metadata"):
+    from .nodes.hybs_load_image_prompt_metadata import (
+        HYBS_LoadImagePromptMetadata,
+        HYBS_LoadImagePromptMetadataAdvance,
+        HYBS_LoadImagePromptMetadataBatch,
+        HYBS_LoadImagePromptText,
+    )
+with startup_timer("hybs_group_bypasser_nodes"):
+    from .nodes.hybs_group_bypasser_nodes import (
+        HYBS_GroupBypasser_Parent,
+        HYBS_GroupBypasser_Child,
+        HYBS_GroupBypasser_Panel,
+    )
 
 class HybsNodesExtension(ComfyExtension):
     """Comfy extension wrapper for HYBS custom nodes."""
 
     async def get_node_list(self) -> list[type[io.ComfyNode]]:
-        return [
+        nodes = [
             HYBS_ResolutionSelector,
             HYBS_RandomResolutionSelector,
             HYBS_SeedListGenerator,
             HYBS_ConditionalLoRALoader,
+            HYBS_ConditionalLoRALoaderList,
             HYBS_LoadLoRA,
             HYBS_DiffusionModelList,
             HYBS_LoRAList,
@@ -42,10 +67,17 @@ class HybsNodesExtension(ComfyExtension):
             HYBS_IntList,
             HYBS_LoadImagePromptMetadata,
             HYBS_LoadImagePromptMetadataAdvance,
+            HYBS_LoadImagePromptText,
+            HYBS_LoadImagePromptMetadataBatch,
             HYBS_GroupBypasser_Parent,
             HYBS_GroupBypasser_Child,
             HYBS_GroupBypasser_Panel,
         ]
+        return [instrument_node(node) for node in nodes]
+
+
+register_routes()
+LOGGER.info("Loaded in %.1f ms", (time.perf_counter() - _import_start) * 1000)
 
 
 async def comfy_entrypoint() -> ComfyExtension:
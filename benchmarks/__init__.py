@@ -0,0 +1 @@
+"""Benchmarks for the HYBS nodes; run with ``python -m benchmarks``."""
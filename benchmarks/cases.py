@@ -0,0 +1,212 @@
+"""Benchmark cases for the HYBS hot paths.
+
+Each case builds its inputs once and returns a zero-argument callable to
+time plus the parameters that describe the workload.
+"""
+
+from __future__ import annotations
+
+import io as _bytes_io
+import json
+import random
+from typing import Any, Callable
+
+from .comfy_stubs import load
+
+Case = Callable[[], tuple[Callable[[], Any], dict[str, Any]]]
+CASES: dict[str, Case] = {}
+
+
+def case(name: str):
+    def register(fn: Case) -> Case:
+        CASES[name] = fn
+        return fn
+
+    return register
+
+
+# ---- Prompt metadata ---------------------------------------------------------
+def _synthetic_workflow(total_nodes: int, subgraphs: int) -> tuple[dict, dict, list[str]]:
+    """Root graph plus subgraph definitions; node IDs repeat across subgraphs like real exports."""
+    per_graph = total_nodes // (subgraphs + 1)
+    root_nodes = []
+    definitions = []
+    prompt = {}
+    targets = []
+    for graph in range(subgraphs + 1):
+        nodes = [
+            {"id": graph * per_graph + i, "type": "CLIPTextEncode", "widgets_values": [f"prompt {graph}:{i}"]}
+            for i in range(per_graph)
+        ]
+        if graph == 0:
+            root_nodes = nodes
+            continue
+        definitions.append({"id": f"sg-{graph}", "nodes": nodes})
+        for node in nodes[:: max(1, per_graph // 4)]:
+            node_id = f"{graph}:{node['id']}"
+            prompt[node_id] = {"class_type": "CLIPTextEncode", "inputs": {"text": f"api {node_id}"}}
+            targets.append(node_id)
+    workflow = {"nodes": root_nodes, "definitions": {"subgraphs": definitions}}
+    return workflow, prompt, targets
+
+
+@case("prompt_from_id_5k_cold")
+def prompt_from_id_cold():
+    """Index build plus two lookups on a fresh 5k-node workflow (first execute on a new image)."""
+    meta = load("nodes.hybs_load_image_prompt_metadata")
+    workflow, prompt, targets = _synthetic_workflow(5000, 49)
+    positive, negative = targets[len(targets) // 2], targets[-1]
+
+    def run():
+        index = meta._NodeIndex(workflow, prompt)
+        meta._prompt_from_id(workflow, prompt, positive, index)
+        meta._prompt_from_id(workflow, prompt, negative, index)
+
+    return run, {"nodes": 5000, "subgraphs": 49}
+
+
+@case("prompt_from_id_5k_warm")
+def prompt_from_id_warm():
+    """Repeated lookups through cached parsed metadata (node IDs edited, same image)."""
+    meta = load("nodes.hybs_load_image_prompt_metadata")
+    workflow, prompt, targets = _synthetic_workflow(5000, 49)
+    parsed = meta._ParsedMetadata(workflow, prompt)
+    lookups = targets[:100]
+
+    def run():
+        for node_id in lookups:
+            parsed.prompt_for(node_id)
+
+    return run, {"nodes": 5000, "lookups": len(lookups)}
+
+
+@case("load_image_tensor_multiframe")
+def load_image_tensor_multiframe():
+    """Decode a 16-frame 512x512 animated image into one tensor."""
+    import torch  # noqa: F401 - the node imports it lazily; skip the case up front when missing
+    from PIL import Image
+
+    meta = load("nodes.hybs_load_image_prompt_metadata")
+    frames = [Image.new("RGB", (512, 512), (i * 16, 255 - i * 16, 128)) for i in range(16)]
+    buffer = _bytes_io.BytesIO()
+    frames[0].save(buffer, format="GIF", save_all=True, append_images=frames[1:])
+    data = buffer.getvalue()
+
+    def run():
+        with Image.open(_bytes_io.BytesIO(data)) as image:
+            meta._load_image_tensor(image)
+
+    return run, {"frames": 16, "width": 512, "height": 512}
+
+
+# ---- Conditional LoRA --------------------------------------------------------
+def _rules_and_prompts(rule_count: int, prompt_count: int) -> tuple[list[dict], list[str]]:
+    rng = random.Random(1234)
+    words = [f"tag{i}" for i in range(rule_count * 2)]
+    entries = []
+    for i in range(rule_count):
+        trigger = rf"\b{words[i]}\b" if i % 3 else rf"(?i){words[i]}(?:_v\d)?"
+        entries.append({"trigger": trigger, "name": f"lora_{i}.safetensors", "strength_model": 0.8})
+    prompts = [
+        ", ".join(rng.choice(words) for _ in range(30)) + ", masterpiece, best quality"
+        for _ in range(prompt_count)
+    ]
+    return entries, prompts
+
+
+@case("lora_rules_1k_x_1k")
+def lora_rules_match():
+    """Match 1000 trigger rules against 1000 distinct prompts."""
+    rules = load("hybs_lora_rules")
+    entries, prompts = _rules_and_prompts(1000, 1000)
+    rule_set = rules.CompiledRuleSet(entries)
+
+    def run():
+        rule_set.match_many(prompts)
+
+    return run, {"rules": 1000, "prompts": 1000}
+
+
+@case("lora_rules_compile_1k")
+def lora_rules_compile():
+    """Build (compile and index) a 1000-rule set, as on a TOML change."""
+    rules = load("hybs_lora_rules")
+    entries, _ = _rules_and_prompts(1000, 0)
+
+    def run():
+        rules.CompiledRuleSet(entries)
+
+    return run, {"rules": 1000}
+
+
+# ---- List nodes --------------------------------------------------------------
+@case("selection_parse_10k_cold")
+def selection_parse_cold():
+    """Validate and execute Int List with a 10k-value selection, memo cleared each time."""
+    selection_mod = load("hybs_selection")
+    int_list = load("nodes.hybs_int_list").HYBS_IntList
+    selection = json.dumps(list(range(10000)))
+
+    def run():
+        selection_mod._parse_string.cache_clear()
+        int_list.validate_inputs(selection)
+        int_list._parse_selection(selection)
+
+    return run, {"values": 10000}
+
+
+@case("selection_parse_10k_warm")
+def selection_parse_warm():
+    """Validate and execute parsing of an already-seen 10k-value selection."""
+    int_list = load("nodes.hybs_int_list").HYBS_IntList
+    selection = json.dumps(list(range(10000)))
+    int_list.validate_inputs(selection)
+
+    def run():
+        int_list.validate_inputs(selection)
+        int_list._parse_selection(selection)
+
+    return run, {"values": 10000}
+
+
+@case("selection_range_expand_100k")
+def selection_range_expand():
+    """Expand a 100k-value Double List range spec."""
+    selection_mod = load("hybs_selection")
+    double_list = load("nodes.hybs_double_list").HYBS_DoubleList
+    selection = json.dumps([{"range": [0.0, 99.999, 0.001]}])
+    items = double_list._parse_selection(selection)
+
+    def run():
+        selection_mod.expand_numeric(items)
+
+    return run, {"values": selection_mod.numeric_length(items)}
+
+
+# ---- Schema option lists -----------------------------------------------------
+@case("schema_options_10k_loras")
+def schema_options():
+    """Build the LoRA option lists of Load LoRA and LoRA List on an unchanged 10k-file store."""
+    import folder_paths
+
+    folder_paths.register("loras", [f"style/lora_{i:05d}.safetensors" for i in range(10000)])
+    load_lora = load("nodes.hybs_load_lora")
+    lora_list = load("nodes.hybs_lora_list").HYBS_LoRAList
+
+    def run():
+        load_lora._LORA_OPTIONS.options()
+        lora_list._lora_options()
+
+    return run, {"loras": 10000}
+
+
+# ---- Seeds -------------------------------------------------------------------
+@case("seed_generation_1m")
+def seed_generation():
+    """Generate 1M unique reproducible seeds."""
+    seeds = load("nodes.hybs_seed_list_generator")
+
+    def run():
+        seeds.generate_seeds(1_000_000, seed=42)
+
+    return run, {"count": 1_000_000}
@@ -0,0 +1,123 @@
+"""Local stand-ins for the ComfyUI modules the HYBS nodes import.
+
+They implement only what the benchmarked code paths touch, with the same
+call shapes as ComfyUI, so node modules can be imported and timed outside a
+running server. Real third-party packages (numpy, torch, Pillow) are never
+stubbed; cases that need a missing one are reported as skipped.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import os
+import sys
+import types
+from typing import Any
+
+PACKAGE_NAME = "hybs_nodes"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".tif", ".tiff")
+
+
+class _Permissive:
+    """Accepts any attribute access or call; stands in for schema builders."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        pass
+
+    def __getattr__(self, name: str) -> "_Permissive":
+        return _Permissive()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "_Permissive":
+        return _Permissive()
+
+
+class _NodeOutput:
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.args = args
+
+
+def _module(name: str, **attrs: Any) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+def _folder_paths(input_dir: str) -> types.ModuleType:
+    state: dict[str, Any] = {"input": input_dir, "files": {}, "cache": {}}
+
+    def register(folder_name: str, names: list[str], base_dir: str = "/models") -> None:
+        state["files"][folder_name] = (list(names), base_dir)
+        state["cache"].pop(folder_name, None)
+
+    def cached_filename_list_(folder_name: str):
+        return state["cache"].get(folder_name)
+
+    def get_filename_list(folder_name: str) -> list[str]:
+        entry = state["cache"].get(folder_name)
+        if entry is None:
+            names, base_dir = state["files"].get(folder_name, ([], ""))
+            entry = state["cache"][folder_name] = (sorted(names), {base_dir: 0.0}, 0.0)
+        return list(entry[0])
+
+    def get_full_path(folder_name: str, name: str) -> str | None:
+        names, base_dir = state["files"].get(folder_name, ([], ""))
+        return os.path.join(base_dir, name) if name in names else None
+
+    def filter_files_content_types(files: list[str], content_types: list[str]) -> list[str]:
+        return [f for f in files if f.lower().endswith(IMAGE_EXTENSIONS)]
+
+    return _module(
+        "folder_paths",
+        register=register,
+        filename_list_cache=state["cache"],
+        cached_filename_list_=cached_filename_list_,
+        get_filename_list=get_filename_list,
+        get_full_path=get_full_path,
+        get_input_directory=lambda: state["input"],
+        get_annotated_filepath=lambda name: os.path.join(state["input"], name),
+        filter_files_content_types=filter_files_content_types,
+    )
+
+
+def _intermediate_dtype():
+    import torch
+
+    return torch.float32
+
+
+def install(input_dir: str) -> types.ModuleType:
+    """Register the stand-ins and return the extension root as an importable package."""
+    _folder_paths(input_dir)
+
+    comfy = _module("comfy")
+    comfy.__path__ = []
+    comfy.utils = _module("comfy.utils", load_torch_file=lambda path, safe_load=True: {})
+    comfy.sd = _module(
+        "comfy.sd",
+        load_lora_for_models=lambda model, clip, lora, sm, sc: (model, clip),
+    )
+    comfy.model_management = _module("comfy.model_management", intermediate_dtype=_intermediate_dtype)
+    _module("node_helpers", pillow=lambda fn, arg: fn(arg))
+
+    io = _Permissive()
+    io.ComfyNode = type("ComfyNode", (), {})
+    io.NodeOutput = _NodeOutput
+    io.Schema = _Permissive
+    comfy_api = _module("comfy_api")
+    comfy_api.__path__ = []
+    comfy_api.latest = _module("comfy_api.latest", io=io, ComfyExtension=type("ComfyExtension", (), {}))
+
+    # Import node modules without running the extension's __init__ (node registration).
+    package = types.ModuleType(PACKAGE_NAME)
+    package.__path__ = [ROOT]
+    package.__spec__ = importlib.util.spec_from_loader(PACKAGE_NAME, loader=None, is_package=True)
+    sys.modules[PACKAGE_NAME] = package
+    return package
+
+
+def load(module: str) -> types.ModuleType:
+    """Import ``module`` (e.g. ``nodes.hybs_int_list``) from the extension package."""
+    return importlib.import_module(f"{PACKAGE_NAME}.{module}")
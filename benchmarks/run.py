@@ -0,0 +1,121 @@
+"""Run the HYBS benchmarks and emit JSON results.
+
+Usage (from the extension root)::
+
+    python -m benchmarks [--only NAME ...] [--repeat N] [--output FILE]
+                         [--baseline FILE] [--tolerance 0.25]
+
+With ``--baseline`` the exit code is 1 when any case's median is slower than
+the baseline median by more than ``tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+from . import comfy_stubs
+
+
+def _time_case(name: str, repeat: int) -> dict[str, Any]:
+    from .cases import CASES
+
+    result: dict[str, Any] = {"name": name}
+    try:
+        run, params = CASES[name]()
+    except ImportError as e:
+        result.update(status="skipped", reason=f"missing dependency: {e.name or e}")
+        return result
+    result["params"] = params
+
+    run()  # warm-up: imports, lazy tables, first-touch allocations
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            samples.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    result.update(
+        status="ok",
+        repeat=repeat,
+        min_s=min(samples),
+        median_s=statistics.median(samples),
+        mean_s=statistics.fmean(samples),
+        max_s=max(samples),
+    )
+    return result
+
+
+def _regressions(results: list[dict], baseline_path: str, tolerance: float) -> list[dict]:
+    with open(baseline_path, encoding="utf-8") as fp:
+        baseline = {r["name"]: r for r in json.load(fp).get("results", []) if r.get("status") == "ok"}
+    regressions = []
+    for result in results:
+        before = baseline.get(result["name"])
+        if result.get("status") != "ok" or before is None:
+            continue
+        ratio = result["median_s"] / before["median_s"] if before["median_s"] else 1.0
+        result["baseline_ratio"] = ratio
+        if ratio > 1.0 + tolerance:
+            regressions.append({"name": result["name"], "ratio": ratio})
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="*", default=None, help="case names to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--baseline", help="previous JSON output to compare medians against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="hybs-bench-") as input_dir:
+        comfy_stubs.install(input_dir)
+        from .cases import CASES
+
+        if args.list:
+            print("\n".join(CASES))
+            return 0
+        names = args.only or list(CASES)
+        unknown = [name for name in names if name not in CASES]
+        if unknown:
+            parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+        results = []
+        for name in names:
+            result = _time_case(name, max(1, args.repeat))
+            results.append(result)
+            summary = f"{result['median_s'] * 1000:.3f} ms" if result["status"] == "ok" else result["reason"]
+            print(f"{name}: {summary}", file=sys.stderr)
+
+    report: dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    regressions = _regressions(results, args.baseline, args.tolerance) if args.baseline else []
+    if args.baseline:
+        report["regressions"] = regressions
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(text + "\n")
+    else:
+        print(text)
+    return 1 if regressions else 0
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import traceback
+from .hybs_logging import get_logger
 
-LOG_PREFIX = '[HYBS]["ComfyAPI"]'
+LOGGER = get_logger("ComfyAPI")
 
 try:
     from comfy_api.latest import ComfyExtension, io
 except Exception as exc:  # pragma: no cover - runtime compatibility path
-    print(f"{LOG_PREFIX} comfy_api.latest import failed, fallback to comfy_api: {exc}")
-    traceback.print_exc()
+    LOGGER.warning("comfy_api.latest import failed, fallback to comfy_api: %s", exc, exc_info=True)
     from comfy_api import ComfyExtension, io
 
 __all__ = ["ComfyExtension", "io"]
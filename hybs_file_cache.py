@@ -0,0 +1,112 @@
+"""LRU cache of values derived from files, keyed by file identity."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+FileKey = tuple[str, int, int]
+
+
+def file_identity(path: str) -> FileKey:
+    """Return (resolved path, mtime_ns, size); a changed file yields a new key."""
+    resolved = os.path.realpath(path)
+    st = os.stat(resolved)
+    return resolved, st.st_mtime_ns, st.st_size
+
+
+class FileLRU:
+    """
+    Thread-safe LRU keyed by :func:`file_identity`.
+
+    Storing a new version of a file drops every entry for older versions of
+    the same path. Entries are bounded by count, by a byte budget (sizes come
+    from ``weigh``), or both; a value larger than the whole budget is returned
+    but not stored, so a budget of 0 disables caching.
+
+    With ``load_under_lock`` concurrent misses for one file load it once, at
+    the cost of serializing loads; otherwise loading runs outside the lock.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        load_under_lock: bool = False,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.load_under_lock = load_under_lock
+        self._entries: OrderedDict[FileKey, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        key: FileKey,
+        load: Callable[[str], Any],
+        weigh: Callable[[Any], int] | None = None,
+    ) -> Any:
+        """Return the cached value for ``key`` or ``load(key[0])`` it and store it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            if self.load_under_lock:
+                value = load(key[0])
+                self._store(key, value, weigh(value) if weigh else 0)
+                return value
+
+        value = load(key[0])
+        nbytes = weigh(value) if weigh else 0
+        with self._lock:
+            self._store(key, value, nbytes)
+        return value
+
+    def _store(self, key: FileKey, value: Any, nbytes: int) -> None:
+        for stale in [k for k in self._entries if k[0] == key[0] and k != key]:
+            self._bytes -= self._entries.pop(stale)[1]
+        if key in self._entries:
+            return  # stored by a concurrent miss
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        self._entries[key] = (value, nbytes)
+        self._bytes += nbytes
+        while len(self._entries) > 1 and self._over_limit():
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self._bytes -= evicted_bytes
+            self.evictions += 1
+
+    def _over_limit(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+            if self.max_bytes is not None:
+                stats["bytes"] = self._bytes
+                stats["budget_bytes"] = self.max_bytes
+            return stats
+
+
+__all__ = ["FileKey", "FileLRU", "file_identity"]
@@ -0,0 +1,73 @@
+"""Shared directory listings, rescanned only when a directory's mtime changes."""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable
+
+from .hybs_metrics import register_collector
+
+
+class _DirectorySnapshot:
+    __slots__ = ("mtime_ns", "files", "derived")
+
+    def __init__(self, mtime_ns: int, files: tuple[str, ...]):
+        self.mtime_ns = mtime_ns
+        self.files = files
+        self.derived: dict[str, Any] = {}
+
+
+class DirectoryIndex:
+    """
+    Per-directory file-name snapshots.
+
+    A lookup costs one ``stat`` of the directory; only a directory whose
+    mtime changed is rescanned with ``os.scandir`` (file type comes from the
+    directory entry, so there is no per-file ``isfile``). Derived views such
+    as filtered option lists are memoized on the snapshot and dropped with it.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[str, _DirectorySnapshot] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.scans = 0
+
+    def _snapshot(self, directory: str) -> _DirectorySnapshot:
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with self._lock:
+            snapshot = self._snapshots.get(directory)
+            if snapshot is not None and snapshot.mtime_ns == mtime_ns:
+                self.hits += 1
+                return snapshot
+            self.scans += 1
+
+        with os.scandir(directory) as entries:
+            files = tuple(sorted(entry.name for entry in entries if entry.is_file()))
+        snapshot = _DirectorySnapshot(mtime_ns, files)
+        with self._lock:
+            self._snapshots[directory] = snapshot
+        return snapshot
+
+    def files(self, directory: str) -> tuple[str, ...]:
+        """Sorted names of regular files directly inside ``directory``."""
+        return self._snapshot(directory).files
+
+    def derived(self, directory: str, key: str, build: Callable[[tuple[str, ...]], Any]) -> Any:
+        """Memoize ``build(files)`` until the directory changes."""
+        snapshot = self._snapshot(directory)
+        value = snapshot.derived.get(key)
+        if value is None:
+            value = snapshot.derived[key] = build(snapshot.files)
+        return value
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "scans": self.scans, "directories": len(self._snapshots)}
+
+
+DIRECTORY_INDEX = DirectoryIndex()
+register_collector("directory_index", DIRECTORY_INDEX.stats)
+
+__all__ = ["DirectoryIndex", "DIRECTORY_INDEX"]
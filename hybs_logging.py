@@ -0,0 +1,220 @@
+"""Package logger: level-gated per node, rate-limited, and written off the executor thread."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from typing import Callable
+
+ROOT_LOGGER = "hybs"
+LEVEL_ENV = "HYBS_LOG_LEVEL"
+NODE_LEVELS_ENV = "HYBS_LOG_LEVELS"
+BURST_ENV = "HYBS_LOG_BURST"
+WINDOW_ENV = "HYBS_LOG_WINDOW"
+DEFAULT_LEVEL = logging.INFO
+# Identical INFO/DEBUG messages (same logger, level and text) allowed per window.
+DEFAULT_BURST = 5
+DEFAULT_WINDOW_SECONDS = 10.0
+# Forget rate-limit state beyond this many distinct messages.
+MAX_TRACKED_MESSAGES = 1024
+
+_labels: dict[str, str] = {}
+_setup_lock = threading.Lock()
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _slug(label: str) -> str:
+    return re.sub(r"[^0-9a-z]+", "_", label.lower()).strip("_")
+
+
+def _parse_level(value: str, default: int) -> int:
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else default
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _node_levels() -> dict[str, int]:
+    """``HYBS_LOG_LEVELS="Conditional LoRA Loader=DEBUG,lora_cache=WARNING"`` -> {slug: level}."""
+    levels = {}
+    for item in os.environ.get(NODE_LEVELS_ENV, "").split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip():
+            levels[_slug(name)] = _parse_level(level, DEFAULT_LEVEL)
+    return levels
+
+
+class _RateLimitFilter(logging.Filter):
+    """
+    Pass at most ``burst`` copies of a message per ``window`` seconds.
+
+    Messages are keyed by logger, level and the formatted text, so only
+    true repeats are dropped. WARNING and above always pass. When a window
+    with suppressed copies ends, a timer hands ``emit`` one summary record;
+    ``flush()`` does the same for every pending count at shutdown.
+    """
+
+    def __init__(self, burst: int, window: float, emit: Callable[[logging.LogRecord], None]):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.emit = emit
+        # key -> [window_start, passed, suppressed]
+        self._seen: dict[tuple[str, int, str], list] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.burst <= 0 or record.levelno >= logging.WARNING:
+            return True
+        try:
+            key = (record.name, record.levelno, record.getMessage())
+        except Exception:
+            return True  # let the handler report the formatting error
+        now = time.monotonic()
+        with self._lock:
+            state = self._seen.get(key)
+            if state is not None and now - state[0] >= self.window:
+                summaries = self._take_expired(now)
+                state = None
+            else:
+                summaries = []
+            if state is None:
+                if len(self._seen) >= MAX_TRACKED_MESSAGES:
+                    summaries += self._take_all()
+                self._seen[key] = [now, 1, 0]
+                passed = True
+            elif state[1] < self.burst:
+                state[1] += 1
+                passed = True
+            else:
+                state[2] += 1
+                passed = False
+                self._schedule(state[0] + self.window - now)
+        self._emit(summaries)
+        return passed
+
+    def flush(self) -> None:
+        """Emit summaries for every message with suppressed copies."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            summaries = self._take_all()
+        self._emit(summaries)
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(max(delay, 0.0), self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._timer = None
+            summaries = self._take_expired(now)
+            pending = [state[0] for state in self._seen.values() if state[2]]
+            if pending:
+                self._schedule(min(pending) + self.window - now)
+        self._emit(summaries)
+
+    def _take_expired(self, now: float) -> list[tuple[tuple[str, int, str], int]]:
+        expired = [key for key, state in self._seen.items() if now - state[0] >= self.window]
+        return [(key, n) for key in expired if (n := self._seen.pop(key)[2])]
+
+    def _take_all(self) -> list[tuple[tuple[str, int, str], int]]:
+        summaries = [(key, state[2]) for key, state in self._seen.items() if state[2]]
+        self._seen.clear()
+        return summaries
+
+    def _emit(self, summaries: list[tuple[tuple[str, int, str], int]]) -> None:
+        for (name, levelno, text), suppressed in summaries:
+            self.emit(logging.LogRecord(
+                name, levelno, __file__, 0,
+                "%s [%d similar message(s) suppressed]", (text, suppressed), None,
+            ))
+
+
+class _PrefixFormatter(logging.Formatter):
+    """Render ``[HYBS]["Label"] message`` like the original per-module prints."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        label = _labels.get(record.name, record.name)
+        text = f'[HYBS]["{label}"] {record.getMessage()}'
+        if record.exc_info:
+            text = f"{text}\n{self.formatException(record.exc_info)}"
+        return text
+
+
+def _configure() -> None:
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(_parse_level(os.environ.get(LEVEL_ENV, ""), DEFAULT_LEVEL))
+        root.propagate = False
+
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        handler = logging.handlers.QueueHandler(records)
+        # Summaries go straight to emit() so the filter does not see them again.
+        limiter = _RateLimitFilter(
+            int(_env_number(BURST_ENV, DEFAULT_BURST)),
+            _env_number(WINDOW_ENV, DEFAULT_WINDOW_SECONDS),
+            handler.emit,
+        )
+        handler.addFilter(limiter)
+        root.addHandler(handler)
+
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(_PrefixFormatter())
+        _listener = logging.handlers.QueueListener(records, stream)
+        _listener.start()
+        # atexit runs last-registered first: flush summaries, then drain the queue.
+        atexit.register(_listener.stop)
+        atexit.register(limiter.flush)
+
+
+def get_logger(label: str) -> logging.Logger:
+    """
+    Logger for one node or module, e.g. ``get_logger("Conditional LoRA Loader")``.
+
+    Its level comes from ``HYBS_LOG_LEVELS`` (by label or slug) and otherwise
+    inherits ``HYBS_LOG_LEVEL``. Records are queued and written by a single
+    listener thread, so logging never waits on stdout.
+    """
+    _configure()
+    name = f"{ROOT_LOGGER}.{_slug(label)}"
+    _labels[name] = label
+    logger = logging.getLogger(name)
+    level = _node_levels().get(_slug(label))
+    if level is not None:
+        logger.setLevel(level)
+    return logger
+
+
+def set_level(label: str | None, level: int | str) -> None:
+    """Change the level of one node's logger, or of the whole package when ``label`` is None."""
+    if isinstance(level, str):
+        level = _parse_level(level, DEFAULT_LEVEL)
+    name = ROOT_LOGGER if label is None else f"{ROOT_LOGGER}.{_slug(label)}"
+    logging.getLogger(name).setLevel(level)
+
+
+__all__ = ["get_logger", "set_level"]
@@ -0,0 +1,185 @@
+"""Shared LRU caches for LoRA state dicts and LoRA-patched model/clip pairs."""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable
+
+from .hybs_file_cache import FileLRU, file_identity
+from .hybs_logging import get_logger
+from .hybs_metrics import count, register_collector
+
+LOGGER = get_logger("LoRA Cache")
+BUDGET_ENV = "HYBS_LORA_CACHE_BYTES"
+DEFAULT_BUDGET_BYTES = 2 * 1024**3
+PATCHED_CACHE_SIZE = 8
+
+
+def _state_dict_nbytes(state_dict: Any, fallback: int) -> int:
+    total = 0
+    values = state_dict.values() if isinstance(state_dict, dict) else ()
+    for value in values:
+        try:
+            total += value.numel() * value.element_size()
+        except Exception:
+            total += int(getattr(value, "nbytes", 0) or 0)
+    return total or fallback
+
+
+def _budget_from_env() -> int:
+    raw = os.environ.get(BUDGET_ENV, "").strip()
+    if not raw:
+        return DEFAULT_BUDGET_BYTES
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        LOGGER.warning("Invalid %s=%r, using default %d", BUDGET_ENV, raw, DEFAULT_BUDGET_BYTES)
+        return DEFAULT_BUDGET_BYTES
+
+
+class LoRAStateDictCache(FileLRU):
+    """Byte-budgeted LRU of loaded LoRA state dicts.
+
+    Keys are (resolved path, mtime_ns, size), so an edited file is re-read and
+    the stale entry is dropped. A budget of 0 disables caching.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        super().__init__(max_bytes=int(budget_bytes))
+
+    @property
+    def budget_bytes(self) -> int:
+        return self.max_bytes
+
+    def load(self, path: str, loader: Callable[[str], Any]) -> Any:
+        key = file_identity(path)
+
+        def read(resolved: str) -> Any:
+            state_dict = loader(resolved)
+            count("bytes_read", "lora", key[2])
+            return state_dict
+
+        return self.get(key, read, lambda state_dict: _state_dict_nbytes(state_dict, key[2]))
+
+
+LORA_STATE_DICTS = LoRAStateDictCache(_budget_from_env())
+register_collector("lora_state_dicts", LORA_STATE_DICTS.stats)
+
+
+def _load_torch_file(path: str) -> Any:
+    import comfy.utils as utils
+
+    return utils.load_torch_file(path, safe_load=True)
+
+
+def load_lora_state_dict(path: str) -> Any:
+    """Load a LoRA file through the shared cache."""
+    return LORA_STATE_DICTS.load(path, _load_torch_file)
+
+
+def lora_cache_stats() -> dict[str, int]:
+    return LORA_STATE_DICTS.stats()
+
+
+class PatchedModelCache:
+    """
+    Entry-bounded LRU of patched (model, clip, *extra) results.
+
+    Keys are the identities of the base model and clip plus a LoRA stack
+    signature. The cache holds nothing strongly: a patched clone shares the
+    base weights and keeps a ``parent`` link to it, so a strong value would
+    pin the base checkpoint. Patched objects are kept through weak
+    references, and an entry lives only while someone else (normally
+    ComfyUI's output cache) still holds its patched model and clip.
+    """
+
+    def __init__(self, max_entries: int = PATCHED_CACHE_SIZE):
+        self.max_entries = int(max_entries)
+        self._entries: OrderedDict[tuple[int, int, tuple], tuple] = OrderedDict()
+        # Re-entrant: a weakref callback can fire from GC while the lock is held.
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, model: Any, clip: Any, stack: tuple) -> Any:
+        key = (id(model), id(clip), stack)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                base_model, base_clip, patched_model, patched_clip, extra = entry
+                value = (patched_model(), patched_clip(), *extra)
+                alive = base_model() is model and base_clip() is clip
+                if alive and value[0] is not None and (value[1] is not None or clip is None):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, model: Any, clip: Any, stack: tuple, value: tuple) -> None:
+        if self.max_entries <= 0:
+            return
+        key = (id(model), id(clip), stack)
+        purge = self._make_purge(key)
+        refs = []
+        for obj in (model, clip, value[0], value[1]):
+            if obj is None:
+                refs.append(lambda: None)
+                continue
+            try:
+                refs.append(weakref.ref(obj, purge))
+            except TypeError:
+                return  # not weak-referenceable; caching it would pin it
+        with self._lock:
+            self._entries[key] = (*refs, tuple(value[2:]))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _make_purge(self, key: tuple):
+        def purge(ref):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and any(r is ref for r in entry[:4]):
+                    del self._entries[key]
+
+        return purge
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+
+PATCHED_MODELS = PatchedModelCache()
+register_collector("patched_models", PATCHED_MODELS.stats)
+
+
+def patched_cache_stats() -> dict[str, int]:
+    return PATCHED_MODELS.stats()
+
+
+__all__ = [
+    "LoRAStateDictCache",
+    "LORA_STATE_DICTS",
+    "PatchedModelCache",
+    "PATCHED_MODELS",
+    "file_identity",
+    "load_lora_state_dict",
+    "lora_cache_stats",
+    "patched_cache_stats",
+]
@@ -0,0 +1,297 @@
+"""Compiled trigger rules for the Conditional LoRA Loader."""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .hybs_file_cache import FileLRU, file_identity
+from .hybs_logging import get_logger
+from .hybs_metrics import register_collector
+
+try:
+    from re import _parser as _sre_parse  # py311+
+    from re import _constants as _sre_constants
+except ImportError:  # pragma: no cover - older Python
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_constants
+
+LOGGER = get_logger("LoRA Rules")
+
+# Below this many rules, one compiled search per rule is already cheap.
+PREFILTER_MIN_RULES = 8
+# Literals shorter than this prune too little to be worth indexing.
+MIN_LITERAL_LENGTH = 2
+# Parsed configs kept in memory (one entry per path/mtime/size).
+RULE_SET_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class LoRARule:
+    index: int
+    trigger: str
+    name: str
+    strength_model: float
+    strength_clip: float
+    pattern: re.Pattern | None
+
+
+# ---- Required-literal extraction ---------------------------------------------
+def _is_ascii_literal(code: int) -> bool:
+    return 0x20 <= code < 0x7F
+
+
+def _best(candidates: list[frozenset[str]]) -> frozenset[str] | None:
+    best = None
+    best_score = None
+    for candidate in candidates:
+        score = (min(len(lit) for lit in candidate), -len(candidate))
+        if best_score is None or score > best_score:
+            best, best_score = candidate, score
+    return best
+
+
+def _required_literals(items, ignorecase: bool) -> frozenset[str] | None:
+    """
+    Return a set of literals, one of which must occur in any text the
+    sub-pattern matches, or None when no such set can be derived.
+    """
+    candidates: list[frozenset[str]] = []
+    run: list[str] = []
+
+    def flush():
+        if run:
+            candidates.append(frozenset(["".join(run)]))
+            run.clear()
+
+    for op, av in items:
+        if op is _sre_constants.LITERAL and _is_ascii_literal(av):
+            run.append(chr(av).lower() if ignorecase else chr(av))
+            continue
+        if op is _sre_constants.AT:
+            # Zero-width anchors (\b, ^, $) do not split a literal run.
+            continue
+        flush()
+        if op is _sre_constants.SUBPATTERN:
+            add_flags, del_flags, sub = av[1], av[2], av[3]
+            if (add_flags | del_flags) & re.IGNORECASE:
+                continue
+            found = _required_literals(sub, ignorecase)
+            if found:
+                candidates.append(found)
+        elif op is _sre_constants.BRANCH:
+            union: set[str] = set()
+            for branch in av[1]:
+                found = _required_literals(branch, ignorecase)
+                if not found:
+                    union = set()
+                    break
+                union.update(found)
+            if union:
+                candidates.append(frozenset(union))
+        elif op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT):
+            if av[0] >= 1:
+                found = _required_literals(av[2], ignorecase)
+                if found:
+                    candidates.append(found)
+    flush()
+
+    candidates = [c for c in candidates if min(len(lit) for lit in c) >= MIN_LITERAL_LENGTH]
+    return _best(candidates)
+
+
+def _analyze(trigger: str) -> tuple[frozenset[str] | None, bool]:
+    try:
+        parsed = _sre_parse.parse(trigger)
+    except Exception:
+        return None, False
+    flags = parsed.state.flags
+    if flags & re.LOCALE:
+        return None, False
+    ignorecase = bool(flags & re.IGNORECASE)
+    return _required_literals(parsed, ignorecase), ignorecase
+
+
+# ---- Multi-literal prefilter -------------------------------------------------
+def _trie_pattern(node: dict[str, dict]) -> str:
+    """Regex for a literal trie; at each node longer continuations are tried first."""
+    alts = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not alts:
+        return ""
+    body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+    if "" in node:
+        return body + "?" if len(alts) > 1 else f"(?:{body})?"
+    return body
+
+
+class _LiteralPrefilter:
+    """
+    One scan of the text reports which indexed literals occur in it.
+
+    The literals are compiled into a prefix trie, so every position costs at
+    most one walk down the trie and reports its longest literal; shorter
+    literals that are prefixes of a reported one are implied and resolved
+    through ``_implied``.
+    """
+
+    def __init__(self, literal_rules: dict[str, set[int]], ignorecase: bool):
+        trie: dict[str, dict] = {}
+        for lit in literal_rules:
+            node = trie
+            for ch in lit:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        flags = re.IGNORECASE if ignorecase else 0
+        self._regex = re.compile(f"(?=({_trie_pattern(trie)}))", flags)
+        self._ignorecase = ignorecase
+        self._implied: dict[str, frozenset[int]] = {}
+        for lit in literal_rules:
+            rules: set[int] = set()
+            for end in range(MIN_LITERAL_LENGTH, len(lit) + 1):
+                rules.update(literal_rules.get(lit[:end], ()))
+            self._implied[lit] = frozenset(rules)
+
+    def _resolve(self, matched: str) -> frozenset[int]:
+        implied = self._implied.get(matched.lower() if self._ignorecase else matched)
+        if implied is not None:
+            return implied
+        # Case-insensitive match on non-ASCII text (e.g. KELVIN SIGN for "k").
+        for lit, rules in self._implied.items():
+            if len(lit) == len(matched) and re.fullmatch(re.escape(lit), matched, re.IGNORECASE):
+                return rules
+        return frozenset()
+
+    def candidates(self, text: str) -> set[int]:
+        found: set[int] = set()
+        seen: set[str] = set()
+        for match in self._regex.finditer(text):
+            matched = match.group(1)
+            if matched not in seen:
+                seen.add(matched)
+                found.update(self._resolve(matched))
+        return found
+
+
+# ---- Rule set ----------------------------------------------------------------
+def _coerce_entry(index: int, entry: Any) -> tuple[str, str, float, float]:
+    if not isinstance(entry, dict):
+        raise ValueError(f"[[lora]] #{index} must be a table")
+    try:
+        sm = float(entry.get("strength_model", 1.0))
+        sc = float(entry.get("strength_clip", 1.0))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"[[lora]] #{index} has an invalid strength: {e}")
+    return str(entry.get("trigger", "") or ""), str(entry.get("name", "") or ""), sm, sc
+
+
+class CompiledRuleSet:
+    """
+    Pre-compiled [[lora]] rules.
+
+    Invalid regexes are reported once when the set is built and never match.
+    For large rule sets, triggers with a required literal are gated by one
+    multi-literal scan of the prompt; only the surviving candidates (and
+    triggers without a usable literal) run their own regex.
+    """
+
+    def __init__(self, entries: Iterable[Any]):
+        rules: list[LoRARule] = []
+        for index, entry in enumerate(entries):
+            trigger, name, sm, sc = _coerce_entry(index, entry)
+            pattern = None
+            if trigger:
+                try:
+                    pattern = re.compile(trigger)
+                except re.error as e:
+                    LOGGER.warning("Invalid regex in TOML #%d %r: %s", index, trigger, e)
+            rules.append(LoRARule(index, trigger, name, sm, sc, pattern))
+        self.rules: tuple[LoRARule, ...] = tuple(rules)
+
+        self._always: tuple[int, ...] = tuple(r.index for r in rules if r.pattern is not None)
+        self._prefilters: tuple[_LiteralPrefilter, ...] = ()
+        if len(self._always) >= PREFILTER_MIN_RULES:
+            self._build_prefilters()
+
+    def _build_prefilters(self) -> None:
+        by_case: dict[bool, dict[str, set[int]]] = {False: {}, True: {}}
+        always = []
+        for index in self._always:
+            literals, ignorecase = _analyze(self.rules[index].trigger)
+            if not literals:
+                always.append(index)
+                continue
+            table = by_case[ignorecase]
+            for lit in literals:
+                table.setdefault(lit, set()).add(index)
+        self._always = tuple(always)
+        self._prefilters = tuple(
+            _LiteralPrefilter(table, ignorecase) for ignorecase, table in by_case.items() if table
+        )
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def candidates(self, text: str) -> list[int]:
+        found = set(self._always)
+        for prefilter in self._prefilters:
+            found.update(prefilter.candidates(text))
+        return sorted(found)
+
+    def match(self, text: str) -> list[LoRARule]:
+        """Return matching rules in file order."""
+        text = text or ""
+        rules = self.rules
+        return [
+            rules[i] for i in self.candidates(text) if rules[i].pattern.search(text) is not None
+        ]
+
+    def match_many(self, texts: Iterable[str]) -> list[tuple[LoRARule, ...]]:
+        """Match every text in one pass; repeated prompts are evaluated once."""
+        memo: dict[str, tuple[LoRARule, ...]] = {}
+        results = []
+        for text in texts:
+            text = text or ""
+            matched = memo.get(text)
+            if matched is None:
+                matched = memo[text] = tuple(self.match(text))
+            results.append(matched)
+        return results
+
+
+# ---- TOML loading ------------------------------------------------------------
+def _parse_toml(path: str) -> list[Any]:
+    try:
+        try:
+            import tomllib as _toml  # py311+
+            with open(path, "rb") as fp:
+                data = _toml.load(fp)
+        except Exception:
+            import toml as _toml
+            with open(path, "r", encoding="utf-8") as fp:
+                data = _toml.load(fp)
+    except Exception as e:
+        raise RuntimeError(f"Failed to parse TOML: {e}")
+    if not isinstance(data, dict) or "lora" not in data or not isinstance(data["lora"], list):
+        raise ValueError("TOML must contain [[lora]] array")
+    return data["lora"]
+
+
+# Parsing happens under the lock, so concurrent validate/execute calls parse a file once.
+_RULE_SETS = FileLRU(max_entries=RULE_SET_CACHE_SIZE, load_under_lock=True)
+register_collector("lora_rule_sets", _RULE_SETS.stats)
+
+
+def load_rule_set(path: str) -> CompiledRuleSet:
+    """Parse, validate and compile a [[lora]] TOML, reusing it until the file changes."""
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    return _RULE_SETS.get(file_identity(path), lambda resolved: CompiledRuleSet(_parse_toml(resolved)))
+
+
+def rule_set_cache_stats() -> dict[str, int]:
+    return _RULE_SETS.stats()
+
+
+__all__ = ["CompiledRuleSet", "LoRARule", "load_rule_set", "rule_set_cache_stats"]
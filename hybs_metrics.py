@@ -0,0 +1,244 @@
+"""Optional per-node timing and counters, exposed on ComfyUI's PromptServer."""
+
+from __future__ import annotations
+
+import array
+import contextlib
+import functools
+import inspect
+import os
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+from .hybs_logging import get_logger
+
+LOGGER = get_logger("Metrics")
+METRICS_ENV = "HYBS_METRICS"
+ROUTE_JSON = "/hybs/metrics"
+ROUTE_PROMETHEUS = "/hybs/metrics/prometheus"
+INSTRUMENTED_METHODS = ("execute", "validate_inputs")
+
+
+def _env_enabled() -> bool:
+    return os.environ.get(METRICS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+# Read once at import: when off, nodes are not wrapped at all and counters return immediately.
+ENABLED = _env_enabled()
+
+
+class _CallStats:
+    __slots__ = ("calls", "errors", "seconds", "max_seconds", "list_items", "max_list_items")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.list_items = 0
+        self.max_list_items = 0
+
+    def as_dict(self) -> dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MetricsRegistry:
+    """
+    Call statistics per (node, method), free-form counters, and pull-based
+    collectors that report existing cache ``stats()`` at scrape time.
+    """
+
+    def __init__(self):
+        self._calls: dict[tuple[str, str], _CallStats] = {}
+        self._counters: dict[tuple[str, str], float] = {}
+        self._collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+        self._startup: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, node: str, method: str, seconds: float, error: bool, list_items: int) -> None:
+        with self._lock:
+            stats = self._calls.get((node, method))
+            if stats is None:
+                stats = self._calls[(node, method)] = _CallStats()
+            stats.calls += 1
+            stats.errors += error
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.list_items += list_items
+            stats.max_list_items = max(stats.max_list_items, list_items)
+
+    def add(self, name: str, label: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[(name, label)] = self._counters.get((name, label), 0) + value
+
+    def record_startup(self, module: str, seconds: float) -> None:
+        with self._lock:
+            self._startup[module] = seconds
+
+    def register_collector(self, name: str, collect: Callable[[], dict[str, Any]]) -> None:
+        with self._lock:
+            self._collectors[name] = collect
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            calls = {f"{node}.{method}": stats.as_dict() for (node, method), stats in self._calls.items()}
+            counters: dict[str, dict[str, float]] = {}
+            for (name, label), value in self._counters.items():
+                counters.setdefault(name, {})[label] = value
+            collectors = dict(self._collectors)
+            startup = dict(self._startup)
+
+        caches = {}
+        for name, collect in collectors.items():
+            try:
+                caches[name] = collect()
+            except Exception as e:
+                caches[name] = {"error": str(e)}
+        return {
+            "enabled": ENABLED,
+            "startup_seconds": startup,
+            "nodes": calls,
+            "counters": counters,
+            "caches": caches,
+        }
+
+    def prometheus(self) -> str:
+        """Render the snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [f"hybs_metrics_enabled {int(snapshot['enabled'])}"]
+        for module, seconds in snapshot["startup_seconds"].items():
+            lines.append(f'hybs_startup_seconds{{module="{_escape(module)}"}} {seconds:.9f}')
+        for key, stats in snapshot["nodes"].items():
+            node, method = key.rsplit(".", 1)
+            labels = f'node="{_escape(node)}",method="{method}"'
+            lines.append(f"hybs_node_calls_total{{{labels}}} {stats['calls']}")
+            lines.append(f"hybs_node_errors_total{{{labels}}} {stats['errors']}")
+            lines.append(f"hybs_node_seconds_total{{{labels}}} {stats['seconds']:.9f}")
+            lines.append(f"hybs_node_seconds_max{{{labels}}} {stats['max_seconds']:.9f}")
+            if method != "execute":
+                continue
+            lines.append(f"hybs_node_list_items_total{{{labels}}} {stats['list_items']}")
+            lines.append(f"hybs_node_list_items_max{{{labels}}} {stats['max_list_items']}")
+        for name, values in snapshot["counters"].items():
+            for label, value in values.items():
+                lines.append(f'hybs_{name}_total{{source="{_escape(label)}"}} {value}')
+        for cache, stats in snapshot["caches"].items():
+            for field, value in stats.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f'hybs_cache_{field}{{cache="{_escape(cache)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._counters.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+METRICS = MetricsRegistry()
+
+
+def count(name: str, label: str, value: float = 1) -> None:
+    """Add to a counter such as ``bytes_read``; a no-op unless metrics are enabled."""
+    if ENABLED:
+        METRICS.add(name, label, value)
+
+
+def register_collector(name: str, collect: Callable[[], dict[str, Any]]) -> None:
+    """Report ``collect()`` (e.g. a cache's ``stats``) with every scrape; costs nothing per call."""
+    METRICS.register_collector(name, collect)
+
+
+@contextlib.contextmanager
+def startup_timer(module: str) -> Iterator[None]:
+    """Time one import block at extension load; always recorded, reported as ``startup_seconds``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        METRICS.record_startup(module, seconds)
+        LOGGER.debug("Imported %s in %.1f ms", module, seconds * 1000)
+
+
+def _list_items(result: Any) -> int:
+    outputs = getattr(result, "args", None)
+    if not isinstance(outputs, tuple):
+        return 0
+    return sum(len(value) for value in outputs if isinstance(value, (list, tuple, array.array)))
+
+
+def _wrap(cls: type, method: str, node_id: str) -> None:
+    original = cls.__dict__.get(method)
+    if not isinstance(original, classmethod):
+        return
+    func = original.__func__
+    measure_lists = method == "execute"
+
+    @functools.wraps(func)
+    def timed(klass, *args, **kwargs):
+        start = time.perf_counter()
+        result = None
+        error = True
+        try:
+            result = func(klass, *args, **kwargs)
+            error = False
+            return result
+        finally:
+            items = _list_items(result) if measure_lists else 0
+            METRICS.observe(node_id, method, time.perf_counter() - start, error, items)
+
+    # ComfyUI reads validate_inputs' parameters with getfullargspec, which
+    # ignores __wrapped__; keep the real ones visible.
+    timed.__signature__ = inspect.signature(func)
+    setattr(cls, method, classmethod(timed))
+
+
+def instrument_node(cls: type) -> type:
+    """Time ``execute``/``validate_inputs`` of a node class when metrics are enabled."""
+    if not ENABLED or cls.__dict__.get("_hybs_instrumented"):
+        return cls
+    for method in INSTRUMENTED_METHODS:
+        _wrap(cls, method, cls.__name__)
+    cls._hybs_instrumented = True
+    return cls
+
+
+def register_routes() -> bool:
+    """Add the JSON and Prometheus routes to PromptServer; returns False outside a server."""
+    try:
+        from aiohttp import web
+        from server import PromptServer
+    except Exception:
+        return False
+    server = getattr(PromptServer, "instance", None)
+    if server is None:
+        return False
+
+    @server.routes.get(ROUTE_JSON)
+    async def hybs_metrics_json(request):
+        return web.json_response(METRICS.snapshot())
+
+    @server.routes.get(ROUTE_PROMETHEUS)
+    async def hybs_metrics_prometheus(request):
+        return web.Response(text=METRICS.prometheus(), content_type="text/plain", charset="utf-8")
+
+    if ENABLED:
+        LOGGER.info("Node timing enabled; metrics at %s and %s", ROUTE_JSON, ROUTE_PROMETHEUS)
+    return True
+
+
+__all__ = [
+    "ENABLED",
+    "METRICS",
+    "MetricsRegistry",
+    "count",
+    "instrument_node",
+    "register_collector",
+    "register_routes",
+    "startup_timer",
+]
@@ -0,0 +1,112 @@
+"""Shared model-name index over folder_paths, refreshed only when ComfyUI rescans a folder."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Iterable
+
+import folder_paths
+
+from .hybs_metrics import register_collector
+
+
+class _FolderSnapshot:
+    __slots__ = ("token", "names", "name_set", "full_paths", "derived")
+
+    def __init__(self, token: Any, names: Iterable[str]):
+        self.token = token
+        self.names = tuple(names)
+        self.name_set = frozenset(self.names)
+        self.full_paths: dict[str, str | None] = {}
+        self.derived: dict[str, Any] = {}
+
+
+def _folder_cache_entry(folder_name: str) -> Any:
+    """
+    Return folder_paths' own cached listing for a folder, or None.
+
+    ``cached_filename_list_`` re-checks folder mtimes and returns the same
+    tuple object until a rescan replaces it, so the entry itself is the
+    invalidation token.
+    """
+    cached = getattr(folder_paths, "cached_filename_list_", None)
+    if cached is None:
+        return None
+    entry = cached(folder_name)
+    if entry is None:
+        folder_paths.get_filename_list(folder_name)
+        entry = cached(folder_name)
+    return entry
+
+
+class ModelNameIndex:
+    """
+    Per-folder frozensets of model names plus memoized full paths.
+
+    Membership checks cost one folder_paths cache validation instead of a
+    list copy and a fresh ``set`` per call. When folder_paths does not expose
+    its cache, every lookup falls back to ``get_filename_list``.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[str, _FolderSnapshot] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.rebuilds = 0
+
+    def _snapshot(self, folder_name: str) -> _FolderSnapshot:
+        entry = _folder_cache_entry(folder_name)
+        if entry is None:
+            with self._lock:
+                self.rebuilds += 1
+            return _FolderSnapshot(None, folder_paths.get_filename_list(folder_name))
+
+        with self._lock:
+            snapshot = self._snapshots.get(folder_name)
+            if snapshot is not None and snapshot.token is entry:
+                self.hits += 1
+                return snapshot
+            self.rebuilds += 1
+            snapshot = self._snapshots[folder_name] = _FolderSnapshot(entry, entry[0])
+            return snapshot
+
+    def names(self, folder_name: str) -> list[str]:
+        """Model names in folder_paths order (a fresh list, safe to extend)."""
+        return list(self._snapshot(folder_name).names)
+
+    def contains(self, folder_name: str, name: str) -> bool:
+        return name in self._snapshot(folder_name).name_set
+
+    def missing(self, folder_name: str, names: Iterable[str]) -> list[str]:
+        """Names not present in the folder, in input order."""
+        name_set = self._snapshot(folder_name).name_set
+        return [name for name in names if name not in name_set]
+
+    def full_path(self, folder_name: str, name: str) -> str | None:
+        """``folder_paths.get_full_path``, memoized until the folder changes."""
+        snapshot = self._snapshot(folder_name)
+        if snapshot.token is None:
+            return folder_paths.get_full_path(folder_name, name)
+        try:
+            return snapshot.full_paths[name]
+        except KeyError:
+            path = snapshot.full_paths[name] = folder_paths.get_full_path(folder_name, name)
+            return path
+
+    def derived(self, folder_name: str, key: str, build: Callable[[tuple[str, ...]], Any]) -> Any:
+        """Memoize ``build(names)`` until folder_paths rescans the folder."""
+        snapshot = self._snapshot(folder_name)
+        value = snapshot.derived.get(key)
+        if value is None:
+            value = snapshot.derived[key] = build(snapshot.names)
+        return value
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "rebuilds": self.rebuilds, "folders": len(self._snapshots)}
+
+
+MODEL_INDEX = ModelNameIndex()
+register_collector("model_index", MODEL_INDEX.stats)
+
+__all__ = ["ModelNameIndex", "MODEL_INDEX"]
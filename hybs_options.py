@@ -0,0 +1,96 @@
+"""Memoized Combo option lists for define_schema, invalidated per source."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Iterable
+
+from .hybs_file_index import DIRECTORY_INDEX
+from .hybs_metrics import register_collector
+from .hybs_model_index import MODEL_INDEX
+
+_PROVIDERS: list[OptionProvider] = []
+
+# ``index.derived(source, key, build)`` of DIRECTORY_INDEX or MODEL_INDEX.
+Derived = Callable[[Any, str, Callable[[tuple[str, ...]], tuple[str, ...]]], tuple[str, ...]]
+
+
+class OptionProvider:
+    """
+    One Combo option list, built on the first ``options()`` call.
+
+    ``source`` (or ``source()`` when callable) names what ``derived`` indexes:
+    a directory for ``DIRECTORY_INDEX.derived``, a folder_paths folder for
+    ``MODEL_INDEX.derived``. The finished list (prefix, selected names, placeholder when empty) is
+    memoized on the source index's snapshot, so a schema refresh costs that
+    index's validation (a directory stat or a folder_paths cache check) and a
+    list copy. A new snapshot drops the memo and the next call rebuilds it.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        derived: Derived,
+        source: Any,
+        select: Callable[[tuple[str, ...]], Iterable[str]] | None = None,
+        prefix: Iterable[str] = (),
+        placeholder: str | None = None,
+    ):
+        self.key = f"options:{key}"
+        self.derived = derived
+        self.source = source
+        self.select = select
+        self.prefix = tuple(prefix)
+        self.placeholder = placeholder
+        self.requests = 0
+        self.builds = 0
+        self._lock = threading.Lock()
+        _PROVIDERS.append(self)
+
+    def _memoized(self) -> tuple[str, ...]:
+        source = self.source() if callable(self.source) else self.source
+        return self.derived(source, self.key, self._build)
+
+    def _build(self, names: tuple[str, ...]) -> tuple[str, ...]:
+        with self._lock:
+            self.builds += 1
+        selected = tuple(self.select(names)) if self.select is not None else names
+        return self._with_placeholder(selected)
+
+    def _with_placeholder(self, selected: tuple[str, ...]) -> tuple[str, ...]:
+        if not selected and self.placeholder is not None:
+            return (*self.prefix, self.placeholder)
+        return (*self.prefix, *selected)
+
+    def options(self) -> list[str]:
+        """Current options as a fresh list."""
+        with self._lock:
+            self.requests += 1
+        try:
+            return list(self._memoized())
+        except OSError:
+            # Missing source directory: offer the placeholder instead of creating it.
+            return list(self._with_placeholder(()))
+
+
+def directory_options(key: str, directory: Callable[[], str], **kwargs) -> OptionProvider:
+    """Files directly inside a directory; revalidated with one ``stat`` of it."""
+    return OptionProvider(key, DIRECTORY_INDEX.derived, directory, **kwargs)
+
+
+def model_folder_options(key: str, folder_name: str, **kwargs) -> OptionProvider:
+    """Model names of a folder_paths folder; revalidated through folder_paths' own cache."""
+    return OptionProvider(key, MODEL_INDEX.derived, folder_name, **kwargs)
+
+
+def option_stats() -> dict[str, int]:
+    return {
+        "providers": len(_PROVIDERS),
+        "requests": sum(provider.requests for provider in _PROVIDERS),
+        "builds": sum(provider.builds for provider in _PROVIDERS),
+    }
+
+
+register_collector("option_lists", option_stats)
+
+__all__ = ["OptionProvider", "directory_options", "model_folder_options", "option_stats"]
@@ -1,7 +1,10 @@
 # Common utilities for resolution combos (defaults + JSON loader)
 import os
 import json
-from typing import List, Tuple
+import math
+import stat
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 # Defaults (used when JSON is missing)
 DEFAULT_COMBOS: List[Tuple[int, int]] = [
@@ -32,35 +35,169 @@ def resolution_config_path() -> str:
     base = os.path.dirname(__file__)  # extension root (this file lives here)
     return os.path.join(base, _CONFIG_DIR, _CONFIG_NAME)
 
-def _validate_pairs(data) -> List[Tuple[int, int]]:
-    if not (
-        isinstance(data, list)
-        and len(data) > 0
-        and all(
-            isinstance(x, (list, tuple)) and len(x) == 2
-            and isinstance(x[0], int) and isinstance(x[1], int)
-            for x in data
-        )
-    ):
+ORIENTATIONS = ("any", "portrait", "landscape", "square")
+
+# (width, height, weight, tags) per configured combo.
+ComboEntry = Tuple[int, int, float, FrozenSet[str]]
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def _validate_entry(item) -> ComboEntry:
+    if isinstance(item, (list, tuple)) and len(item) == 2 and _is_int(item[0]) and _is_int(item[1]):
+        return item[0], item[1], 1.0, frozenset()
+    if isinstance(item, dict) and _is_int(item.get("width")) and _is_int(item.get("height")):
+        weight = item.get("weight", 1)
+        tags = item.get("tags", [])
+        if (
+            isinstance(weight, (int, float)) and not isinstance(weight, bool) and math.isfinite(weight) and weight > 0
+            and isinstance(tags, list) and all(isinstance(t, str) for t in tags)
+        ):
+            return item["width"], item["height"], float(weight), frozenset(t.strip().lower() for t in tags if t.strip())
+    raise ValueError(
+        f"{_CONFIG_NAME} must be a non-empty list of [width, height] integer pairs "
+        "or {\"width\", \"height\", \"weight\", \"tags\"} objects (weight > 0)."
+    )
+
+def _validate_entries(data) -> List[ComboEntry]:
+    if not (isinstance(data, list) and len(data) > 0):
         raise ValueError(f"{_CONFIG_NAME} must be a non-empty list of [width, height] integer pairs.")
-    return [tuple(x) for x in data]  # type: ignore
+    return [_validate_entry(x) for x in data]
 
-def load_resolution_combos() -> List[Tuple[int, int]]:
+def _orientation(w: int, h: int) -> str:
+    return "portrait" if h > w else "landscape" if w > h else "square"
+
+def _mix64(x: int) -> int:
+    """SplitMix64 finalizer: spreads consecutive seeds over 64 bits."""
+    x = (x + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return x ^ (x >> 31)
+
+def _alias_table(weights: List[float]) -> Tuple[List[float], List[int]]:
+    """Vose's alias method: O(n) build, O(1) weighted pick."""
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    return prob, alias
+
+class ResolutionSampler:
+    """
+    Deterministic seed -> (width, height) over a fixed combo subset.
+    Equal weights keep the legacy ``seed % len(combos)`` mapping; otherwise the
+    seed is hashed and drawn through a precomputed alias table.
     """
-    Load combos from JSON; raise on parse/format errors; fallback to DEFAULT_COMBOS when file is missing.
+
+    def __init__(self, combos: List[Tuple[int, int]], weights: List[float]):
+        self.combos = combos
+        self.weighted = len(set(weights)) > 1
+        if self.weighted:
+            self._prob, self._alias = _alias_table(weights)
+
+    def __len__(self) -> int:
+        return len(self.combos)
+
+    def pick(self, seed: int) -> Tuple[int, int]:
+        n = len(self.combos)
+        if not self.weighted:
+            return self.combos[seed % n]
+        r1 = _mix64(seed)
+        column = r1 % n
+        coin = (_mix64(r1) >> 11) * (1.0 / (1 << 53))
+        return self.combos[column if coin < self._prob[column] else self._alias[column]]
+
+# Distinct filter combinations kept per loaded table.
+SAMPLER_CACHE_SIZE = 64
+
+class ResolutionTable:
+    """Validated combos with weights and tags; filtered samplers are built once and memoized."""
+
+    def __init__(self, entries: List[ComboEntry]):
+        self.entries = entries
+        self.combos: List[Tuple[int, int]] = [(w, h) for (w, h, _, _) in entries]
+        self._samplers: Dict[tuple, ResolutionSampler] = {}
+        self._lock = threading.Lock()
+
+    def sampler(self, tag: str = "", orientation: str = "any",
+                min_megapixels: float = 0.0, max_megapixels: float = 0.0) -> ResolutionSampler:
+        """Sampler over combos with ``tag``, ``orientation`` and a pixel budget (0 = no limit)."""
+        tag = (tag or "").strip().lower()
+        key = (tag, orientation, float(min_megapixels), float(max_megapixels))
+        with self._lock:
+            sampler = self._samplers.get(key)
+            if sampler is not None:
+                return sampler
+        min_pixels = float(min_megapixels) * 1_000_000
+        max_pixels = float(max_megapixels) * 1_000_000
+        picked = [
+            (w, h, weight)
+            for (w, h, weight, tags) in self.entries
+            if (not tag or tag in tags)
+            and (orientation in ("", "any") or _orientation(w, h) == orientation)
+            and w * h >= min_pixels
+            and (max_pixels <= 0 or w * h <= max_pixels)
+        ]
+        if not picked:
+            raise ValueError(
+                f"No resolution combos match tag={tag!r}, orientation={orientation!r}, "
+                f"megapixels={min_megapixels}..{max_megapixels or 'any'}."
+            )
+        sampler = ResolutionSampler([(w, h) for (w, h, _) in picked], [weight for (_, _, weight) in picked])
+        with self._lock:
+            if len(self._samplers) >= SAMPLER_CACHE_SIZE:
+                self._samplers.clear()
+            self._samplers[key] = sampler
+        return sampler
+
+_DEFAULT_TABLE = ResolutionTable([(w, h, 1.0, frozenset()) for (w, h) in DEFAULT_COMBOS])
+
+def _config_stat() -> Optional[os.stat_result]:
+    """Single stat of the config file; None when it is missing or not a regular file."""
+    try:
+        st = os.stat(resolution_config_path())
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+# Compiled table of the last loaded file, keyed by (mtime_ns, size).
+_table_cache_lock = threading.Lock()
+_table_cache: Optional[Tuple[Tuple[int, int], ResolutionTable]] = None
+
+def load_resolution_table() -> ResolutionTable:
+    """
+    Load and compile combos from JSON; raise on parse/format errors; fallback to defaults when file is missing.
+    The table is cached until the file's mtime or size changes and is shared between callers.
     (Exceptions bubble to UI; do not print duplicate logs.)
     """
-    path = resolution_config_path()
-    if os.path.isfile(path):
-        with open(path, encoding="utf-8") as f:
+    global _table_cache
+    st = _config_stat()
+    if st is None:
+        return _DEFAULT_TABLE
+    key = (st.st_mtime_ns, st.st_size)
+    with _table_cache_lock:
+        if _table_cache is not None and _table_cache[0] == key:
+            return _table_cache[1]
+        with open(resolution_config_path(), encoding="utf-8") as f:
             data = json.load(f)  # may raise JSONDecodeError
-        return _validate_pairs(data)
-    return DEFAULT_COMBOS
+        table = ResolutionTable(_validate_entries(data))
+        _table_cache = (key, table)
+        return table
+
+def load_resolution_combos() -> List[Tuple[int, int]]:
+    """(width, height) pairs of the cached table; shared between callers, so do not mutate."""
+    return load_resolution_table().combos
 
 def get_resolution_config_mtime() -> float:
     """Return mtime for fingerprinting; 0 if missing or error."""
-    path = resolution_config_path()
-    try:
-        return os.path.getmtime(path) if os.path.isfile(path) else 0.0
-    except Exception:
-        return 0.0
\ No newline at end of file
+    st = _config_stat()
+    return st.st_mtime if st is not None else 0.0
@@ -0,0 +1,305 @@
+"""Shared parsing for the frontend-managed ``selection`` inputs of list nodes."""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
+
+from .hybs_metrics import register_collector
+
+# Distinct raw selection strings kept parsed (validate and execute share them).
+SELECTION_CACHE_SIZE = 64
+# Upper bound on the values a numeric selection may expand to.
+MAX_EXPANDED_VALUES = 10_000_000
+# Float sweeps are rounded to this many decimals to hide step accumulation noise.
+RANGE_DECIMALS = 12
+# Beyond this magnitude a float has no digits left at RANGE_DECIMALS, and
+# np.round's internal scaling would lose precision or overflow.
+RANGE_ROUND_LIMIT = 2.0**52 / 10**RANGE_DECIMALS
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def selection_values(selection: Any) -> list:
+    """Return the raw JSON list behind a selection, or [] when it is malformed."""
+    if isinstance(selection, dict):
+        values = selection.get("selected", [])
+    elif isinstance(selection, str):
+        try:
+            values = json.loads(selection)
+        except json.JSONDecodeError:
+            values = []
+    else:
+        values = []
+
+    return values if isinstance(values, list) else []
+
+
+@lru_cache(maxsize=SELECTION_CACHE_SIZE)
+def _parse_string(selection: str, coerce: Callable[[list], list]) -> tuple:
+    return tuple(coerce(selection_values(selection)))
+
+
+def parse_selection(selection: Any, coerce: Callable[[list], list]) -> list:
+    """
+    Parse a selection payload and coerce its items with ``coerce``.
+
+    String payloads are memoized per (string, coerce), so validate_inputs and
+    execute parse the same selection once. A fresh list is returned each time,
+    so callers may hand it downstream without sharing the cached value.
+    """
+    if isinstance(selection, str):
+        return list(_parse_string(selection, coerce))
+    return list(coerce(selection_values(selection)))
+
+
+@dataclass(frozen=True)
+class NumericRange:
+    """
+    A numeric sweep inside a selection, kept unexpanded until execute.
+
+    ``{"range": [start, stop, step]}`` includes ``stop`` when the step lands on
+    it; ``{"linspace": [start, stop, num]}`` and
+    ``{"logspace": [start, stop, num, base]}`` follow NumPy (base defaults to 10).
+    Integer sweeps hold Python ints and expand exactly: ``step`` is the value
+    step for ranges and the exponent step for logspace.
+    """
+
+    kind: str
+    start: float
+    stop: float
+    step: float
+    num: int
+    base: float = 10.0
+    integer: bool = False
+
+    def __len__(self) -> int:
+        return self.num
+
+    def expand(self):
+        import numpy as np
+
+        if self.integer:
+            # Wrap-around uint64 arithmetic is exact for every value that fits int64,
+            # and validation guarantees all of them do.
+            steps = np.arange(self.num, dtype=np.uint64) * np.uint64(self.step % 2**64)
+            values = (steps + np.uint64(self.start % 2**64)).view(np.int64)
+            if self.kind == "logspace":
+                return np.power(np.int64(self.base), values)
+            return values
+        if self.kind == "range":
+            values = self.start + self.step * np.arange(self.num, dtype=np.float64)
+        elif self.kind == "linspace":
+            values = np.linspace(self.start, self.stop, self.num, dtype=np.float64)
+        else:
+            values = np.logspace(self.start, self.stop, self.num, base=self.base, dtype=np.float64)
+        # Sweeps are monotonic, so the endpoints bound every magnitude.
+        if max(abs(values[0]), abs(values[-1])) < RANGE_ROUND_LIMIT:
+            return np.round(values, RANGE_DECIMALS)
+        small = np.abs(values) < RANGE_ROUND_LIMIT
+        return np.where(small, np.round(np.where(small, values, 0.0), RANGE_DECIMALS), values)
+
+
+@dataclass(frozen=True)
+class InvalidRange:
+    """A range object that cannot be expanded; reported by validation."""
+
+    spec: str
+    reason: str
+
+    def message(self) -> str:
+        return f"Invalid range {self.spec}: {self.reason}"
+
+
+def _float_range(kind: str, args: list) -> NumericRange:
+    try:
+        numbers = [float(arg) for arg in args]
+    except (TypeError, ValueError):
+        raise ValueError("arguments must be numbers")
+    if not all(math.isfinite(number) for number in numbers):
+        raise ValueError("arguments must be finite")
+    if kind == "range":
+        if len(numbers) not in (2, 3):
+            raise ValueError("expected [start, stop] or [start, stop, step]")
+        start, stop = numbers[:2]
+        step = numbers[2] if len(numbers) == 3 else 1.0
+        steps = (stop - start) / step if step else -1.0
+        if steps < 0 or not math.isfinite(steps):
+            raise ValueError("step must be non-zero and point from start to stop")
+        _check_float_step(start, stop, step)
+        # The epsilon keeps an inclusive stop such as 0.05..2.0 step 0.05.
+        num = int(math.floor(steps + 1e-9)) + 1
+        return NumericRange(kind, start, stop, step, num)
+    if len(numbers) not in (3, 4) or numbers[2] < 1 or not numbers[2].is_integer():
+        raise ValueError(f"expected [start, stop, num{', base' if kind == 'logspace' else ''}] with num >= 1")
+    start, stop, num = numbers[0], numbers[1], int(numbers[2])
+    base = numbers[3] if len(numbers) == 4 else 10.0
+    if kind == "linspace":
+        if not math.isfinite(stop - start):
+            raise ValueError("start and stop are too far apart")
+        if num > 1:
+            _check_float_step(start, stop, (stop - start) / (num - 1))
+    else:
+        if base <= 0:
+            raise ValueError("base must be positive")
+        try:
+            math.pow(base, start), math.pow(base, stop)
+        except OverflowError:
+            raise ValueError("base**start and base**stop must be finite")
+    return NumericRange(kind, start, stop, 0.0, num, base)
+
+
+def _check_float_step(start: float, stop: float, step: float) -> None:
+    """Reject sweeps whose step is lost to rounding at the endpoints' magnitude."""
+    if step and abs(step) < math.ulp(max(abs(start), abs(stop))):
+        raise ValueError("step is below float precision at these endpoints")
+
+
+def _exact_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("arguments must be integers")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise ValueError("arguments must be integers")
+
+
+def _integer_steps(start: int, stop: int, step: int) -> int:
+    """Number of values of an inclusive integer sweep start, start+step, ... <= stop."""
+    if step == 0:
+        if start != stop:
+            raise ValueError("step must be non-zero")
+        return 1
+    if (stop - start) * step < 0:
+        raise ValueError("step must point from start to stop")
+    return (stop - start) // step + 1
+
+
+def _check_int64(*values: int) -> None:
+    for value in values:
+        if not INT64_MIN <= value <= INT64_MAX:
+            raise ValueError(f"{value} does not fit a 64-bit integer")
+
+
+def _integer_range(kind: str, args: list) -> NumericRange:
+    numbers = [_exact_int(arg) for arg in args]
+    if kind == "range":
+        if len(numbers) not in (2, 3):
+            raise ValueError("expected [start, stop] or [start, stop, step]")
+        start, stop = numbers[:2]
+        step = numbers[2] if len(numbers) == 3 else 1
+        num = _integer_steps(start, stop, step)
+        last = start + (num - 1) * step
+        _check_int64(start, last)
+        return NumericRange(kind, start, last, step, num, integer=True)
+
+    if len(numbers) not in (3, 4) or numbers[2] < 1:
+        raise ValueError(f"expected [start, stop, num{', base' if kind == 'logspace' else ''}] with num >= 1")
+    start, stop, num = numbers[:3]
+    if num == 1:
+        step = 0
+    elif (stop - start) % (num - 1):
+        raise ValueError(f"{num} values from {start} to {stop} are not evenly spaced integers")
+    else:
+        step = (stop - start) // (num - 1)
+    if kind == "linspace":
+        _check_int64(start, stop)
+        return NumericRange(kind, start, stop, step, num, integer=True)
+
+    base = numbers[3] if len(numbers) == 4 else 10
+    _check_int64(start, stop)
+    if min(start, stop) < 0 or base < 1:
+        raise ValueError("integer logspace needs exponents >= 0 and base >= 1")
+    if max(start, stop) > 63 and base > 1:
+        raise ValueError(f"{base}**{max(start, stop)} does not fit a 64-bit integer")
+    _check_int64(base ** max(start, stop))
+    return NumericRange(kind, start, stop, step, num, base, integer=True)
+
+
+def _range_spec(value: dict, integer: bool) -> NumericRange | InvalidRange | None:
+    for kind in ("range", "linspace", "logspace"):
+        args = value.get(kind)
+        if args is None:
+            continue
+        spec = json.dumps({kind: args}, default=str)
+        if not isinstance(args, list):
+            return InvalidRange(spec, "arguments must be a list")
+        try:
+            return _integer_range(kind, args) if integer else _float_range(kind, args)
+        except ValueError as e:
+            return InvalidRange(spec, str(e))
+    return None
+
+
+def coerce_numeric(values: list, cast: Callable[[Any], Any], integer: bool = False) -> list:
+    """
+    Coerce plain items with ``cast``; range objects become NumericRange, or
+    InvalidRange when they cannot be expanded. Other invalid items are dropped.
+
+    With ``integer`` ranges are computed with exact integer arithmetic and
+    must use integer arguments.
+    """
+    parsed = []
+    for value in values:
+        if isinstance(value, dict):
+            spec = _range_spec(value, integer)
+            if spec is not None:
+                parsed.append(spec)
+            continue
+        try:
+            parsed.append(cast(value))
+        except (TypeError, ValueError):
+            continue
+    return parsed
+
+
+def range_errors(items: list) -> list[str]:
+    """Messages for range objects in ``items`` that cannot be expanded."""
+    return [item.message() for item in items if isinstance(item, InvalidRange)]
+
+
+def numeric_length(items: list) -> int:
+    """Number of values ``items`` expands to, computed without expanding."""
+    return sum(
+        item.num if isinstance(item, NumericRange) else 0 if isinstance(item, InvalidRange) else 1
+        for item in items
+    )
+
+
+def expand_numeric(items: list) -> list:
+    """Expand ranges in place of their spec; plain values are kept as-is."""
+    values = []
+    for item in items:
+        if isinstance(item, NumericRange):
+            values.extend(item.expand().tolist())
+        elif isinstance(item, InvalidRange):
+            raise ValueError(item.message())
+        else:
+            values.append(item)
+    return values
+
+
+def selection_cache_stats() -> dict[str, int]:
+    info = _parse_string.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "entries": info.currsize}
+
+
+register_collector("selection", selection_cache_stats)
+
+
+__all__ = [
+    "InvalidRange",
+    "MAX_EXPANDED_VALUES",
+    "NumericRange",
+    "coerce_numeric",
+    "expand_numeric",
+    "numeric_length",
+    "parse_selection",
+    "range_errors",
+    "selection_cache_stats",
+    "selection_values",
+]
@@ -1,24 +1,24 @@
 """Conditional LoRA loader node."""
 
+import logging
 import os
-import re
-from typing import Any
+from typing import Iterable
 
 from ..hybs_comfy_api import io
+from ..hybs_logging import get_logger
+from ..hybs_lora_cache import PATCHED_MODELS, file_identity, load_lora_state_dict
+from ..hybs_lora_rules import CompiledRuleSet, LoRARule, load_rule_set
+from ..hybs_model_index import MODEL_INDEX
+from ..hybs_options import directory_options
 
-try:
-    from comfy import sd
-except Exception:
-    sd = None
-
-import folder_paths
-import comfy.utils as utils
-
-LOG_PREFIX = '[HYBS]["Conditional LoRA Loader"]'
-
-
-def _log(message: str) -> None:
-    print(f"{LOG_PREFIX} {message}")
+LOGGER = get_logger("Conditional LoRA Loader")
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config")
+_TOML_OPTIONS = directory_options(
+    "lora_condition_tomls",
+    lambda: CONFIG_DIR,
+    select=lambda files: (f for f in files if f.lower().endswith(".toml")),
+    placeholder="<put .toml in config>",
+)
 
 
 # ---- Type fallback helpers ---------------------------------------------------
@@ -43,58 +43,134 @@ _CLIP = _resolve_type("CLIP")
 
 
 # ---- Internal: LoRA applier --------------------------------------------------
+def _comfy_sd():
+    """comfy.sd, imported on the first LoRA application instead of at extension load."""
+    try:
+        from comfy import sd
+    except Exception:
+        return None
+    return sd
+
+
 def _apply_lora(model, clip, lora_path: str, lora_name: str, sm: float, sc: float):
-    # 1) comfy.sd.load_lora
+    sd = _comfy_sd()
+
+    # 1) comfy.sd.load_lora_for_models with the shared state-dict cache
+    if sd is not None and hasattr(sd, "load_lora_for_models"):
+        try:
+            lora = load_lora_state_dict(lora_path)
+            m, c = sd.load_lora_for_models(model, clip, lora, sm, sc)
+            return m, c, True
+        except Exception as e:
+            LOGGER.warning("comfy.sd.load_lora_for_models failed: %s", e)
+
+    # 2) comfy.sd.load_lora
     if sd is not None and hasattr(sd, "load_lora"):
         try:
             m, c = sd.load_lora(model, clip, lora_path, sm, sc)
             return m, c, True
         except Exception as e:
-            _log(f"comfy.sd.load_lora failed: {e}")
+            LOGGER.warning("comfy.sd.load_lora failed: %s", e)
 
-    # 2) built-in nodes.LoraLoader
+    # 3) built-in nodes.LoraLoader
     try:
         from nodes import LoraLoader as _BuiltinLoraLoader
         try:
             m, c = _BuiltinLoraLoader().load_lora(model, clip, lora_name, sm, sc)
             return m, c, True
         except Exception as e:
-            _log(f"nodes.LoraLoader failed: {e}")
+            LOGGER.warning("nodes.LoraLoader failed: %s", e)
     except Exception:
         pass
 
-    # 3) low-level fallback
+    # 4) low-level fallback
     try:
-        lora = utils.load_torch_file(lora_path, safe_load=True)
+        import comfy.utils as utils
+
+        lora = load_lora_state_dict(lora_path)
         if hasattr(utils, "apply_lora"):
             model = utils.apply_lora(model, lora, sm)
             if clip is not None and sc != 0.0 and hasattr(utils, "apply_lora_to_clip"):
                 clip = utils.apply_lora_to_clip(clip, lora, sc)
             return model, clip, True
     except Exception as e:
-        _log(f"fallback apply_lora failed: {e}")
+        LOGGER.warning("fallback apply_lora failed: %s", e)
 
-    _log("All loaders failed -> passthrough.")
+    LOGGER.warning("All loaders failed -> passthrough.")
     return model, clip, False
 
 
-# ---- Node (V3 schema) --------------------------------------------------------
-class HYBS_ConditionalLoRALoader(io.ComfyNode):
-    CONFIG_DIR = None
+def _stack_signature(resolved) -> tuple | None:
+    """Canonical key for an ordered LoRA stack: file identity plus strengths."""
+    try:
+        return tuple(
+            (file_identity(path), rule.strength_model, rule.strength_clip) for rule, path in resolved
+        )
+    except OSError:
+        return None
 
-    @classmethod
-    def _ensure_config_dir(cls) -> str:
-        if cls.CONFIG_DIR is None:
-            base = os.path.dirname(os.path.dirname(__file__))
-            cls.CONFIG_DIR = os.path.join(base, "config")
-            os.makedirs(cls.CONFIG_DIR, exist_ok=True)
-        return cls.CONFIG_DIR
 
+def _apply_rules(model, clip, rules: Iterable[LoRARule]):
+    """Apply matched rules in order; returns (model, clip, applied tokens string)."""
+    resolved = []
+    for rule in rules:
+        lora_path = MODEL_INDEX.full_path("loras", rule.name)
+        if not lora_path:
+            LOGGER.warning("LoRA not found: %s", rule.name)
+            continue
+        resolved.append((rule, lora_path))
+
+    stack = _stack_signature(resolved) if resolved else None
+    if stack:
+        cached = PATCHED_MODELS.get(model, clip, stack)
+        if cached is not None:
+            LOGGER.debug("Reusing patched model/clip for %d LoRA(s)", len(stack))
+            return cached
+
+    base_model, base_clip = model, clip
+    applied_any = False
+    failed = False
+    applied_tokens = []
+
+    for rule, lora_path in resolved:
+        name = rule.name
+        sm = rule.strength_model
+        sc = rule.strength_clip
+
+        try:
+            new_model, new_clip, applied = _apply_lora(model, clip, lora_path, name, sm, sc)
+            if applied:
+                LOGGER.info("Applied LoRA: %s (m=%s, c=%s)", name, sm, sc)
+                model, clip = new_model, new_clip
+                applied_any = True
+                # Build token with filename (no extension, no quotes)
+                base = os.path.basename(name)
+                stem, _ = os.path.splitext(base)
+                token = f"<lora:{stem}:{sm}:{sc}>"
+                applied_tokens.append(token)
+            else:
+                failed = True
+                LOGGER.warning("Failed to apply LoRA: %s", name)
+        except Exception as e:
+            failed = True
+            LOGGER.warning("Exception while applying LoRA %r: %s", name, e)
+
+    if not applied_any:
+        LOGGER.info("No LoRA applied (passthrough)")
+
+    applied_str = " ".join(applied_tokens) if applied_tokens else ""
+    result = (model, clip, applied_str)
+    if stack and not failed:
+        PATCHED_MODELS.put(base_model, base_clip, stack, result)
+    return result
+
+
+# ---- Node (V3 schema) --------------------------------------------------------
+class HYBS_ConditionalLoRALoader(io.ComfyNode):
     @classmethod
     def _list_toml(cls) -> list[str]:
-        cdir = cls._ensure_config_dir()
-        files = [f for f in os.listdir(cdir) if f.lower().endswith(".toml")]
-        return sorted(files) if files else ["<put .toml in config>"]
+        """TOML files in config/, memoized until the directory changes (never created here)."""
+        return _TOML_OPTIONS.options()
 
     @classmethod
     def define_schema(cls) -> io.Schema:
@@ -130,35 +206,10 @@ class HYBS_ConditionalLoRALoader(io.ComfyNode):
                         'Outputs tokens like <lora:"name":m:c> (space-separated).'
         )
 
-    @staticmethod
-    def _match(positive: str, pattern: str) -> bool:
-        if not pattern:
-            return False
-        try:
-            return re.search(pattern, positive or "") is not None
-        except re.error as e:
-            _log(f"Invalid regex in TOML: {e}")
-            return False
-
     @classmethod
-    def _load_toml(cls, fname: str) -> list[dict[str, Any]]:
-        full = os.path.join(cls._ensure_config_dir(), fname)
-        if not os.path.isfile(full):
-            raise FileNotFoundError(full)
-        try:
-            try:
-                import tomllib as _toml  # py311+
-                with open(full, "rb") as fp:
-                    data = _toml.load(fp)
-            except Exception:
-                import toml as _toml
-                with open(full, "r", encoding="utf-8") as fp:
-                    data = _toml.load(fp)
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse TOML: {e}")
-        if not isinstance(data, dict) or "lora" not in data or not isinstance(data["lora"], list):
-            raise ValueError("TOML must contain [[lora]] array")
-        return data["lora"]
+    def _rule_set(cls, fname: str) -> CompiledRuleSet:
+        """Compiled rules for a config, shared process-wide until the file changes."""
+        return load_rule_set(os.path.join(CONFIG_DIR, fname))
 
     @classmethod
     def execute(
@@ -169,59 +220,107 @@ class HYBS_ConditionalLoRALoader(io.ComfyNode):
         config_toml: str
     ) -> io.NodeOutput:
         try:
-            entries = cls._load_toml(config_toml)
+            rule_set = cls._rule_set(config_toml)
         except Exception as e:
-            _log(f"TOML load error: {e}")
+            LOGGER.error("TOML load error: %s", e)
             return io.NodeOutput(model, clip, "")
 
-        src = positive or ""
-        applied_any = False
-        applied_tokens = []
-
-        for i, ent in enumerate(entries):
-            trig = ent.get("trigger", "")
-            name = ent.get("name", "")
-            sm = float(ent.get("strength_model", 1.0))
-            sc = float(ent.get("strength_clip", 1.0))
-
-            matched = cls._match(src, trig)
-            _log(f"#{i} matched={matched} trigger={trig!r} name={name!r} sm={sm} sc={sc}")
-            if not matched:
-                continue
-
-            lora_path = folder_paths.get_full_path("loras", name)
-            if not lora_path:
-                _log(f"LoRA not found: {name}")
-                continue
-
-            try:
-                new_model, new_clip, applied = _apply_lora(model, clip, lora_path, name, sm, sc)
-                if applied:
-                    _log(f"Applied LoRA: {name} (m={sm}, c={sc})")
-                    model, clip = new_model, new_clip
-                    applied_any = True
-                    # Build token with filename (no extension, no quotes)
-                    base = os.path.basename(name)
-                    stem, _ = os.path.splitext(base)
-                    token = f"<lora:{stem}:{sm}:{sc}>"
-                    applied_tokens.append(token)
-                else:
-                    _log(f"Failed to apply LoRA: {name}")
-            except Exception as e:
-                _log(f"Exception while applying LoRA {name!r}: {e}")
-
-        if not applied_any:
-            _log("No LoRA applied (passthrough)")
-
-        applied_str = " ".join(applied_tokens) if applied_tokens else ""
-        return io.NodeOutput(model, clip, applied_str)
+        matched_rules = rule_set.match(positive or "")
+        LOGGER.info("%d/%d rules matched", len(matched_rules), len(rule_set.rules))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            matched_indices = {rule.index for rule in matched_rules}
+            for rule in rule_set.rules:
+                LOGGER.debug(
+                    "#%d matched=%s trigger=%r name=%r sm=%s sc=%s",
+                    rule.index, rule.index in matched_indices, rule.trigger,
+                    rule.name, rule.strength_model, rule.strength_clip,
+                )
+
+        return io.NodeOutput(*_apply_rules(model, clip, matched_rules))
 
     @classmethod
     def fingerprint_inputs(cls, config_toml=None, **kwargs) -> str:
         try:
-            base = cls._ensure_config_dir()
-            path = os.path.join(base, config_toml) if config_toml else None
+            path = os.path.join(CONFIG_DIR, config_toml) if config_toml else None
             mtime = os.path.getmtime(path) if path and os.path.isfile(path) else 0
         except Exception:
             mtime = 0
         return f"{config_toml}:{mtime}"
+
+
+class HYBS_ConditionalLoRALoaderList(io.ComfyNode):
+    """Evaluate conditional LoRA rules for a LIST of prompts, patching once per distinct LoRA set."""
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        tomls = HYBS_ConditionalLoRALoader._list_toml()
+        return io.Schema(
+            node_id="HYBS_ConditionalLoRALoaderList",
+            display_name="Conditional LoRA Loader (List)",
+            category="HYBS/ConditionalLoRALoader",
+            search_aliases=["lora list", "batch conditional lora", "prompt list lora"],
+            essentials_category="Loaders/LoRA",
+            inputs=[
+                _Model.Input("model"),
+                _CLIP.Input("clip"),
+                io.Custom("LIST").Input(
+                    "prompts",
+                    tooltip="Positive prompts to be matched against regex patterns.",
+                ),
+                io.Combo.Input(
+                    "config_toml",
+                    options=tomls,
+                    tooltip="TOML filename under config/ with [[lora]] entries."
+                ),
+            ],
+            outputs=[
+                _Model.Output(display_name="models", is_output_list=True),
+                _CLIP.Output(display_name="clips", is_output_list=True),
+                io.String.Output(display_name="applied loras", is_output_list=True),
+                io.Int.Output(display_name="count"),
+                io.String.Output(display_name="prompts", is_output_list=True),
+            ],
+            description="Conditionally apply LoRAs to each prompt in a list. "
+                        "Prompts that match the same LoRA set share one patched model/clip. "
+                        "Outputs are ComfyUI output lists, so downstream nodes run once per prompt.",
+        )
+
+    @staticmethod
+    def _coerce_prompts(prompts) -> list[str]:
+        if isinstance(prompts, str):
+            return [prompts]
+        if prompts is None:
+            return []
+        return ["" if prompt is None else str(prompt) for prompt in prompts]
+
+    @classmethod
+    def execute(cls, model, clip, prompts, config_toml: str) -> io.NodeOutput:
+        prompts = cls._coerce_prompts(prompts)
+        if not prompts:
+            raise ValueError("No prompts were provided.")
+
+        count = len(prompts)
+        try:
+            rule_set = HYBS_ConditionalLoRALoader._rule_set(config_toml)
+        except Exception as e:
+            LOGGER.error("TOML load error: %s", e)
+            return io.NodeOutput([model] * count, [clip] * count, [""] * count, count, prompts)
+
+        # Group prompts by the ordered LoRA stack they select; each stack is patched once.
+        patched: dict[tuple, tuple] = {}
+        models, clips, applied = [], [], []
+        for matched in rule_set.match_many(prompts):
+            stack = tuple((rule.name, rule.strength_model, rule.strength_clip) for rule in matched)
+            result = patched.get(stack)
+            if result is None:
+                result = patched[stack] = _apply_rules(model, clip, matched)
+            models.append(result[0])
+            clips.append(result[1])
+            applied.append(result[2])
+
+        LOGGER.info("%d prompts -> %d distinct LoRA sets", count, len(patched))
+        return io.NodeOutput(models, clips, applied, count, prompts)
+
+    @classmethod
+    def fingerprint_inputs(cls, config_toml=None, **kwargs) -> str:
+        return HYBS_ConditionalLoRALoader.fingerprint_inputs(config_toml=config_toml, **kwargs)
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-import json
-
-import folder_paths
-
 from ..hybs_comfy_api import io
+from ..hybs_logging import get_logger
+from ..hybs_model_index import MODEL_INDEX
+from ..hybs_options import model_folder_options
+from ..hybs_selection import parse_selection
 
-LOG_PREFIX = '[HYBS]["Diffusion Model List"]'
+LOGGER = get_logger("Diffusion Model List")
+_MODEL_OPTIONS = model_folder_options("diffusion_model_list", "diffusion_models")
 
 
-def _log(message: str) -> None:
-    print(f"{LOG_PREFIX} {message}")
+def _coerce_model_names(values: list) -> list[str]:
+    return [value for value in values if isinstance(value, str) and value.strip()]
 
 
 class HYBS_DiffusionModelList(io.ComfyNode):
@@ -20,24 +21,11 @@ class HYBS_DiffusionModelList(io.ComfyNode):
 
     @classmethod
     def _diffusion_model_options(cls) -> list[str]:
-        return folder_paths.get_filename_list("diffusion_models")
+        return _MODEL_OPTIONS.options()
 
     @classmethod
     def _parse_selection(cls, selection) -> list[str]:
-        if isinstance(selection, dict):
-            values = selection.get("selected", [])
-        elif isinstance(selection, str):
-            try:
-                values = json.loads(selection)
-            except json.JSONDecodeError:
-                values = []
-        else:
-            values = []
-
-        if not isinstance(values, list):
-            return []
-
-        return [value for value in values if isinstance(value, str) and value.strip()]
+        return parse_selection(selection, _coerce_model_names)
 
     @classmethod
     def define_schema(cls) -> io.Schema:
@@ -69,8 +57,7 @@ class HYBS_DiffusionModelList(io.ComfyNode):
         if not selected_names:
             return "At least one diffusion model is required."
 
-        available = set(folder_paths.get_filename_list("diffusion_models"))
-        missing = [name for name in selected_names if name not in available]
+        missing = MODEL_INDEX.missing("diffusion_models", selected_names)
         if missing:
             return f"Unknown diffusion models: {', '.join(missing)}"
         return True
@@ -81,5 +68,5 @@ class HYBS_DiffusionModelList(io.ComfyNode):
         if not selected_names:
             raise ValueError("No diffusion models were provided.")
 
-        _log(f"Selected {len(selected_names)} diffusion models")
+        LOGGER.info("Selected %d diffusion models", len(selected_names))
         return io.NodeOutput(selected_names, len(selected_names))
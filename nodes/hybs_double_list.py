@@ -2,42 +2,30 @@
 
 from __future__ import annotations
 
-import json
-
 from ..hybs_comfy_api import io
+from ..hybs_logging import get_logger
+from ..hybs_selection import (
+    MAX_EXPANDED_VALUES,
+    coerce_numeric,
+    expand_numeric,
+    numeric_length,
+    parse_selection,
+    range_errors,
+)
 
-LOG_PREFIX = '[HYBS]["Double List"]'
+LOGGER = get_logger("Double List")
 
 
-def _log(message: str) -> None:
-    print(f"{LOG_PREFIX} {message}")
+def _coerce_floats(values: list) -> list:
+    return coerce_numeric(values, float)
 
 
 class HYBS_DoubleList(io.ComfyNode):
     """Return float values as a list."""
 
     @classmethod
-    def _parse_selection(cls, selection) -> list[float]:
-        if isinstance(selection, dict):
-            values = selection.get("selected", [])
-        elif isinstance(selection, str):
-            try:
-                values = json.loads(selection)
-            except json.JSONDecodeError:
-                values = []
-        else:
-            values = []
-
-        if not isinstance(values, list):
-            return []
-
-        parsed = []
-        for value in values:
-            try:
-                parsed.append(float(value))
-            except (TypeError, ValueError):
-                continue
-        return parsed
+    def _parse_selection(cls, selection) -> list:
+        return parse_selection(selection, _coerce_floats)
 
     @classmethod
     def define_schema(cls) -> io.Schema:
@@ -64,15 +52,25 @@ class HYBS_DoubleList(io.ComfyNode):
 
     @classmethod
     def validate_inputs(cls, selection="[1.0]", **kwargs) -> bool | str:
-        if not cls._parse_selection(selection):
+        items = cls._parse_selection(selection)
+        errors = range_errors(items)
+        if errors:
+            return errors[0]
+        count = numeric_length(items)
+        if not count:
             return "At least one double value is required."
+        if count > MAX_EXPANDED_VALUES:
+            return f"Selection expands to {count} values; at most {MAX_EXPANDED_VALUES} are allowed."
         return True
 
     @classmethod
     def execute(cls, selection="[1.0]", **kwargs) -> io.NodeOutput:
-        values = cls._parse_selection(selection)
+        items = cls._parse_selection(selection)
+        if numeric_length(items) > MAX_EXPANDED_VALUES:
+            raise ValueError(f"Selection expands to more than {MAX_EXPANDED_VALUES} values.")
+        values = expand_numeric(items)
         if not values:
             raise ValueError("No double values were provided.")
 
-        _log(f"Selected {len(values)} double values")
+        LOGGER.info("Selected %d double values", len(values))
         return io.NodeOutput(values, len(values))
@@ -2,33 +2,48 @@
 
 from __future__ import annotations
 
+import fnmatch
+import hashlib
 import json
 import os
-from typing import Any
+import re
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable
 
-import numpy as np
-import torch
-from PIL import Image, ImageOps, ImageSequence, UnidentifiedImageError
-
-import comfy.model_management
-import node_helpers
 import folder_paths
 
 from ..hybs_comfy_api import io
-
-LOG_PREFIX = '[HYBS]["Load Image Prompt Metadata"]'
+from ..hybs_file_cache import FileLRU, file_identity
+from ..hybs_file_index import DIRECTORY_INDEX
+from ..hybs_logging import get_logger
+from ..hybs_metrics import count as count_metric, register_collector
+from ..hybs_options import directory_options
+from ..hybs_selection import parse_selection
+
+if TYPE_CHECKING:
+    import torch
+    from PIL import Image
+
+LOGGER = get_logger("Load Image Prompt Metadata")
 ADVANCED_MAX_PROMPTS = 20
+# Parsed workflow/prompt dicts kept in memory, keyed by (path, mtime_ns, size).
+METADATA_CACHE_SIZE = 16
+# Upper bound for the batch loader's worker pool (I/O and zlib release the GIL).
+BATCH_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
 
-def _log(message: str) -> None:
-    print(f"{LOG_PREFIX} {message}")
+def _image_files(files: tuple[str, ...]) -> list[str]:
+    return sorted(folder_paths.filter_files_content_types(list(files), ["image"]))
 
 
-def _image_options() -> list[str]:
-    input_dir = folder_paths.get_input_directory()
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    files = folder_paths.filter_files_content_types(files, ["image"])
-    return sorted(files) if files else ["<put images in input>"]
+_IMAGE_OPTIONS = directory_options(
+    "input_images",
+    folder_paths.get_input_directory,
+    select=_image_files,
+    placeholder="<put images in input>",
+)
 
 
 def _get_annotated_path(filename: str) -> str:
@@ -52,6 +67,243 @@ def _extract_image_metadata(image: Image.Image) -> dict[str, Any]:
     return metadata
 
 
+# ---- Direct metadata readers (no pixel decode) -------------------------------
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_TEXT_CHUNKS = (b"tEXt", b"zTXt", b"iTXt")
+PNG_METADATA_KEYS = ("prompt", "workflow", "comfyui_workflow", "comfyui workflow")
+PNG_WORKFLOW_KEYS = frozenset(PNG_METADATA_KEYS) - {"prompt"}
+# Upper bound for one text payload, compressed or inflated.
+MAX_TEXT_CHUNK_BYTES = 256 * 1024 * 1024
+_EXIF_TEXT_TYPES = (2, 7)  # ASCII, UNDEFINED
+_PREFIXED_JSON = re.compile(r"^([A-Za-z_][\w ]*):\s*(?=[\[{])")
+
+
+def _add_text_entry(metadata: dict[str, Any], key: str, value: Any) -> None:
+    metadata[key] = value
+    # ComfyUI stores WebP/JPEG metadata in EXIF as "workflow:{...}" / "prompt:{...}".
+    text = _decode_metadata_value(value)
+    match = _PREFIXED_JSON.match(text) if text else None
+    if match and match.group(1) not in metadata:
+        metadata[match.group(1)] = text[match.end():]
+
+
+def _parse_exif(data: bytes) -> dict[str, Any]:
+    metadata: dict[str, Any] = {}
+    if data.startswith(b"Exif\x00\x00"):
+        data = data[6:]
+    if len(data) < 8 or data[:2] not in (b"II", b"MM"):
+        return metadata
+    endian = "<" if data[:2] == b"II" else ">"
+    try:
+        (ifd_offset,) = struct.unpack_from(endian + "I", data, 4)
+        (count,) = struct.unpack_from(endian + "H", data, ifd_offset)
+        for index in range(count):
+            entry = ifd_offset + 2 + 12 * index
+            tag, type_id, length = struct.unpack_from(endian + "HHI", data, entry)
+            if type_id not in _EXIF_TEXT_TYPES:
+                continue
+            if length <= 4:
+                raw = data[entry + 8:entry + 8 + length]
+            else:
+                (value_offset,) = struct.unpack_from(endian + "I", data, entry + 8)
+                raw = data[value_offset:value_offset + length]
+            value = raw.decode("utf-8", "replace").rstrip("\x00") if type_id == 2 else raw
+            _add_text_entry(metadata, str(tag), value)
+    except struct.error:
+        pass
+    return metadata
+
+
+def _inflate(data: bytes) -> bytes:
+    inflater = zlib.decompressobj()
+    text = inflater.decompress(data, MAX_TEXT_CHUNK_BYTES)
+    if inflater.unconsumed_tail:
+        raise ValueError("compressed PNG text chunk exceeds size limit")
+    return text
+
+
+def _parse_png_text_chunk(chunk_type: bytes, body: bytes) -> str | None:
+    """Decode a tEXt/zTXt/iTXt payload (after the keyword and its NUL)."""
+    if chunk_type == b"tEXt":
+        return body.decode("latin-1")
+    if chunk_type == b"zTXt" and body:
+        return _inflate(body[1:]).decode("latin-1")
+    if chunk_type == b"iTXt" and len(body) >= 2:
+        compressed, rest = body[0], body[2:]
+        _language, _, rest = rest.partition(b"\x00")
+        _translated, _, text = rest.partition(b"\x00")
+        return (_inflate(text) if compressed else text).decode("utf-8", "replace")
+    return None
+
+
+def _read_png_metadata(fp: BinaryIO) -> dict[str, Any]:
+    """
+    Walk the PNG chunk table and return only prompt/workflow text chunks.
+
+    Only wanted text payloads are read; every other chunk, including IDAT,
+    is skipped with a seek. Scanning stops at the first IDAT once both the
+    prompt and a workflow have been seen; otherwise it keeps walking chunk
+    headers to catch text written after the image data.
+    """
+    metadata: dict[str, Any] = {}
+    fp.seek(len(PNG_SIGNATURE))
+    while True:
+        header = fp.read(8)
+        if len(header) < 8:
+            break
+        length, chunk_type = struct.unpack(">I4s", header)
+        if chunk_type == b"IEND":
+            break
+        if chunk_type == b"IDAT" and _has_prompt_and_workflow(metadata):
+            break
+        if chunk_type not in PNG_TEXT_CHUNKS or length > MAX_TEXT_CHUNK_BYTES:
+            fp.seek(length + 4, os.SEEK_CUR)  # payload + CRC
+            continue
+
+        # Keywords are at most 79 bytes; peek at them before reading the payload.
+        prefix = fp.read(min(length, 80))
+        keyword, sep, body = prefix.partition(b"\x00")
+        key = keyword.decode("latin-1")
+        if not sep or key.lower() not in PNG_METADATA_KEYS:
+            fp.seek(length - len(prefix) + 4, os.SEEK_CUR)
+            continue
+
+        body += fp.read(length - len(prefix))
+        fp.seek(4, os.SEEK_CUR)  # CRC
+        try:
+            text = _parse_png_text_chunk(chunk_type, body)
+        except (zlib.error, ValueError) as e:
+            LOGGER.warning("Skipping unreadable PNG %s chunk %r: %s", chunk_type.decode(), key, e)
+            continue
+        if text is not None:
+            metadata[key] = text
+    return metadata
+
+
+def _has_prompt_and_workflow(metadata: dict[str, Any]) -> bool:
+    keys = {key.lower() for key in metadata}
+    return "prompt" in keys and not keys.isdisjoint(PNG_WORKFLOW_KEYS)
+
+
+def _read_webp_metadata(fp: BinaryIO) -> dict[str, Any]:
+    metadata: dict[str, Any] = {}
+    fp.seek(12)
+    while True:
+        header = fp.read(8)
+        if len(header) < 8:
+            break
+        fourcc, size = struct.unpack("<4sI", header)
+        padded = size + (size & 1)
+        if fourcc == b"EXIF":
+            metadata.update(_parse_exif(fp.read(size)))
+            fp.seek(padded - size, os.SEEK_CUR)
+        else:
+            fp.seek(padded, os.SEEK_CUR)
+    return metadata
+
+
+def _read_jpeg_metadata(fp: BinaryIO) -> dict[str, Any]:
+    metadata: dict[str, Any] = {}
+    fp.seek(2)
+    while True:
+        marker = fp.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            break
+        code = marker[1]
+        if code == 0xFF:
+            fp.seek(-1, os.SEEK_CUR)  # fill byte
+            continue
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue  # standalone markers
+        if code in (0xD9, 0xDA):
+            break  # EOI / start of scan: entropy-coded data follows
+        raw_length = fp.read(2)
+        if len(raw_length) < 2:
+            break
+        (length,) = struct.unpack(">H", raw_length)
+        if code == 0xE1 or code == 0xFE:
+            payload = fp.read(length - 2)
+            if code == 0xE1 and payload.startswith(b"Exif\x00\x00"):
+                metadata.update(_parse_exif(payload))
+            elif code == 0xFE:
+                _add_text_entry(metadata, "comment", payload)
+        else:
+            fp.seek(length - 2, os.SEEK_CUR)
+    return metadata
+
+
+class _CountingReader:
+    """File wrapper that tallies the bytes ``read()`` returns; seeks are free."""
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fp.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fp, name)
+
+
+def _read_file_metadata(fp: BinaryIO) -> dict[str, Any] | None:
+    """
+    Read text metadata straight from PNG/WebP/JPEG containers without
+    decoding pixels. Returns None for other formats.
+    """
+    fp.seek(0)
+    head = fp.read(12)
+    if head.startswith(PNG_SIGNATURE):
+        return _read_png_metadata(fp)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return _read_webp_metadata(fp)
+    if head[:3] == b"\xff\xd8\xff":
+        return _read_jpeg_metadata(fp)
+    return None
+
+
+def _has_metadata_keys(metadata: dict[str, Any] | None) -> bool:
+    return bool(metadata) and any(key.lower() in PNG_METADATA_KEYS for key in metadata)
+
+
+def _read_image_metadata(fp: BinaryIO) -> dict[str, Any] | None:
+    """Direct container read; None when it finds no prompt/workflow entries."""
+    try:
+        metadata = _read_file_metadata(fp)
+    except OSError:
+        return None
+    return metadata if _has_metadata_keys(metadata) else None
+
+
+def _with_image(source: str | BinaryIO, image: str, read: Callable[[Image.Image], Any]) -> Any:
+    # PIL and node_helpers are imported on first use so extension load stays free of them.
+    import node_helpers
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with node_helpers.pillow(Image.open, source) as img:
+            return read(img)
+    except UnidentifiedImageError as exc:
+        raise ValueError(f"Could not load image: {image}") from exc
+
+
+def _read_metadata_only(image_path: str, image: str) -> dict[str, Any]:
+    with open(image_path, "rb") as raw:
+        fp = _CountingReader(raw)
+        try:
+            metadata = _read_image_metadata(fp)
+            if metadata is not None:
+                return metadata
+
+            # PIL parses headers on open and only decodes pixels on load().
+            fp.seek(0)
+            return _with_image(fp, image, _extract_image_metadata)
+        finally:
+            count_metric("bytes_read", "image_metadata", fp.bytes_read)
+
+
 def _decode_metadata_value(value: Any) -> str | None:
     if value is None:
         return None
@@ -163,47 +415,69 @@ def _normalize_node_id(node_id: Any) -> str:
     return str(node_id or "").strip()
 
 
-def _node_id_matches(actual_id: Any, target_id: str) -> bool:
-    actual = _normalize_node_id(actual_id)
-    if not actual or not target_id:
-        return False
-    return actual == target_id or actual == target_id.rsplit(":", 1)[-1]
-
-
-def _prompt_from_workflow_id(workflow: dict[str, Any] | None, node_id: Any) -> str:
-    target_id = _normalize_node_id(node_id)
-    if not workflow or not target_id:
-        return ""
+def _trailing_id(node_id: str) -> str:
+    return node_id.rsplit(":", 1)[-1]
 
-    for node in _iter_nodes(workflow):
-        if not _node_id_matches(node.get("id"), target_id):
-            continue
 
-        widgets_values = node.get("widgets_values", [])
-        prompt = _first_string(widgets_values)
-        if prompt:
-            return prompt
+class _NodeIndex:
+    """
+    One-pass index of workflow nodes and API prompt keys by node ID.
 
-        return _first_string(node.get("properties", {}))
+    Workflow lookups follow the original scan semantics: a target such as
+    ``82:78`` matches a node whose ID is ``82:78`` or ``78``, and the node
+    reached first by ``_iter_nodes`` wins. IDs shared by several nodes are
+    recorded in ``ambiguous``.
+    """
 
-    return ""
+    def __init__(self, workflow: dict[str, Any] | None, prompt: dict[str, Any] | None):
+        self._nodes: dict[str, tuple[int, dict[str, Any]]] = {}
+        self.ambiguous: dict[str, int] = {}
+        if workflow:
+            for position, node in enumerate(_iter_nodes(workflow)):
+                node_id = _normalize_node_id(node.get("id"))
+                if not node_id:
+                    continue
+                if node_id in self._nodes:
+                    self.ambiguous[node_id] = self.ambiguous.get(node_id, 1) + 1
+                else:
+                    self._nodes[node_id] = (position, node)
+
+        self._prompt = prompt or {}
+        self._prompt_by_trailing: dict[str, list[str]] = {}
+        for key in self._prompt:
+            self._prompt_by_trailing.setdefault(_trailing_id(_normalize_node_id(key)), []).append(key)
+
+    def workflow_node(self, target_id: str) -> dict[str, Any] | None:
+        exact = self._nodes.get(target_id)
+        trailing = self._nodes.get(_trailing_id(target_id))
+        found = [entry for entry in (exact, trailing) if entry is not None]
+        return min(found, key=lambda entry: entry[0])[1] if found else None
+
+    def prompt_node(self, target_id: str) -> dict[str, Any] | None:
+        node = self._prompt.get(target_id)
+        if not isinstance(node, dict):
+            keys = self._prompt_by_trailing.get(target_id, [])
+            node = self._prompt[keys[0]] if len(keys) == 1 else None
+        return node if isinstance(node, dict) else None
+
+    def ambiguity(self, target_id: str) -> int:
+        return max(self.ambiguous.get(target_id, 0), self.ambiguous.get(_trailing_id(target_id), 0))
+
+
+def _prompt_from_workflow_node(node: dict[str, Any] | None) -> str:
+    if node is None:
+        return ""
 
+    widgets_values = node.get("widgets_values", [])
+    prompt = _first_string(widgets_values)
+    if prompt:
+        return prompt
 
-def _prompt_from_api_prompt_id(prompt: dict[str, Any] | None, node_id: Any) -> str:
-    target_id = _normalize_node_id(node_id)
-    if not prompt or not target_id:
-        return ""
+    return _first_string(node.get("properties", {}))
 
-    node = prompt.get(target_id)
-    if not isinstance(node, dict):
-        matches = [
-            value
-            for key, value in prompt.items()
-            if _normalize_node_id(key).rsplit(":", 1)[-1] == target_id
-        ]
-        node = matches[0] if len(matches) == 1 else None
 
-    if not isinstance(node, dict):
+def _prompt_from_api_node(node: dict[str, Any] | None) -> str:
+    if node is None:
         return ""
 
     inputs = node.get("inputs", {})
@@ -219,20 +493,90 @@ def _prompt_from_api_prompt_id(prompt: dict[str, Any] | None, node_id: Any) -> s
     return ""
 
 
-def _prompt_from_id(workflow: dict[str, Any] | None, prompt: dict[str, Any] | None, node_id: Any) -> str:
-    result = _prompt_from_workflow_id(workflow, node_id)
+def _prompt_from_id(
+    workflow: dict[str, Any] | None,
+    prompt: dict[str, Any] | None,
+    node_id: Any,
+    index: _NodeIndex | None = None,
+) -> str:
+    target_id = _normalize_node_id(node_id)
+    if not target_id:
+        return ""
+    if index is None:
+        index = _NodeIndex(workflow, prompt)
+
+    result = _prompt_from_workflow_node(index.workflow_node(target_id))
     if result:
         return result
-    return _prompt_from_api_prompt_id(prompt, node_id)
+    return _prompt_from_api_node(index.prompt_node(target_id))
+
+
+# ---- Parsed metadata cache ---------------------------------------------------
+class _ParsedMetadata:
+    """Decoded workflow/prompt dicts for one image, with a lazily built node-ID index."""
+
+    def __init__(self, workflow: dict[str, Any] | None, prompt: dict[str, Any] | None):
+        self.workflow = workflow
+        self.prompt = prompt
+        self._index: _NodeIndex | None = None
+        self._prompts: dict[str, str] = {}
+
+    @property
+    def empty(self) -> bool:
+        return self.workflow is None and self.prompt is None
+
+    def prompt_for(self, node_id: Any) -> str:
+        key = _normalize_node_id(node_id)
+        text = self._prompts.get(key)
+        if text is None:
+            if self._index is None:
+                self._index = _NodeIndex(self.workflow, self.prompt)
+            shared = self._index.ambiguity(key)
+            if shared:
+                LOGGER.warning("Node ID %r matches %d workflow nodes; using the first one", key, shared)
+            text = self._prompts[key] = _prompt_from_id(self.workflow, self.prompt, key, self._index)
+        return text
+
+
+def _parse_metadata_file(image_path: str, image: str) -> _ParsedMetadata:
+    metadata = _read_metadata_only(image_path, image)
+    return _ParsedMetadata(_find_workflow(metadata), _find_prompt(metadata))
+
+
+_METADATA_CACHE = FileLRU(max_entries=METADATA_CACHE_SIZE)
+register_collector("prompt_metadata", _METADATA_CACHE.stats)
+
+
+def _load_parsed_metadata(image_path: str, image: str) -> _ParsedMetadata:
+    parsed = _METADATA_CACHE.get(
+        file_identity(image_path), lambda resolved: _parse_metadata_file(resolved, image)
+    )
+    if parsed.empty:
+        raise ValueError(f"No ComfyUI workflow or prompt metadata found in {image!r}")
+    return parsed
 
 
 def _load_image_tensor(image: Image.Image) -> torch.Tensor:
-    output_images = []
-    width = None
-    height = None
+    """
+    Decode frames straight into one preallocated [N, H, W, 3] tensor.
+
+    Each frame is copied as uint8 into its slot (converting to the target
+    dtype) and scaled in place, so no float32 staging array or final
+    torch.cat is needed and peak memory stays close to the output size.
+    """
+    import comfy.model_management
+    import node_helpers
+    import numpy as np
+    import torch
+    from PIL import ImageOps, ImageSequence
+
     dtype = comfy.model_management.intermediate_dtype()
     excluded_formats = ["MPO"]
+    single_frame = getattr(image, "format", None) in excluded_formats
+    capacity = 1 if single_frame else max(1, int(getattr(image, "n_frames", 1) or 1))
 
+    output = None
+    count = 0
     for frame in ImageSequence.Iterator(image):
         frame = node_helpers.pillow(ImageOps.exif_transpose, frame)
 
@@ -240,40 +584,88 @@ def _load_image_tensor(image: Image.Image) -> torch.Tensor:
             frame = frame.point(lambda i: i * (1 / 255))
 
         frame = frame.convert("RGB")
-        if not output_images:
-            width, height = frame.size
-        elif frame.size != (width, height):
+        width, height = frame.size
+        if output is None:
+            output = torch.empty((capacity, height, width, 3), dtype=dtype)
+        elif (width, height) != (output.shape[2], output.shape[1]):
             continue
+        if count == capacity:
+            break
 
-        array = np.asarray(frame).astype(np.float32) / 255.0
-        tensor = torch.from_numpy(array)[None,].to(dtype=dtype)
-        output_images.append(tensor)
+        pixels = torch.from_numpy(np.array(frame, dtype=np.uint8))
+        output[count].copy_(pixels).div_(255.0)
+        count += 1
 
-        if getattr(image, "format", None) in excluded_formats:
+        if single_frame:
             break
 
-    if not output_images:
+    if output is None or count == 0:
         raise ValueError("No image frames could be loaded.")
 
-    if len(output_images) > 1:
-        return torch.cat(output_images, dim=0)
+    if count < capacity:
+        # Only when some frames were skipped for a size mismatch.
+        return output[:count].clone()
+
+    return output
+
+
+def _image_input():
+    image_input_kwargs = {
+        "options": _IMAGE_OPTIONS.options(),
+        "tooltip": "Image file from ComfyUI's input folder.",
+    }
+    if hasattr(io, "UploadType"):
+        image_input_kwargs["upload"] = io.UploadType.image
+    if hasattr(io, "FolderType"):
+        image_input_kwargs["image_folder"] = io.FolderType.input
+    return io.Combo.Input("image", **image_input_kwargs)
+
+
+def _decode_image(image_path: str, image: str) -> torch.Tensor:
+    return _with_image(image_path, image, _load_image_tensor)
+
+
+def _decode_image_input():
+    return io.Boolean.Input(
+        "decode_image",
+        default=True,
+        tooltip="Decode pixels for the IMAGE output. Turn off when only the prompt outputs are used.",
+    )
+
+
+def _placeholder_image() -> torch.Tensor:
+    """Small black image returned on the IMAGE output when decoding is turned off."""
+    import torch
+
+    return torch.zeros((1, 64, 64, 3), dtype=torch.float32)
+
+
+def _maybe_decode_image(image_path: str, image: str, decode_image: bool) -> torch.Tensor:
+    return _decode_image(image_path, image) if decode_image else _placeholder_image()
+
+
+def _positive_negative(
+    parsed: _ParsedMetadata,
+    positive_node_id: str,
+    negative_node_id: str,
+) -> tuple[str, str]:
+    positive = parsed.prompt_for(positive_node_id)
+    negative = parsed.prompt_for(negative_node_id)
+    missing = []
+    if not positive:
+        missing.append(f"positive node ID {positive_node_id!r}")
+    if not negative:
+        missing.append(f"negative node ID {negative_node_id!r}")
+    if missing:
+        raise ValueError(f"Could not extract prompt text for: {', '.join(missing)}")
+    return positive, negative
 
-    return output_images[0]
 
 class HYBS_LoadImagePromptMetadata(io.ComfyNode):
     """Load an image and return prompt strings from embedded workflow metadata."""
 
     @classmethod
     def define_schema(cls) -> io.Schema:
-        image_input_kwargs = {
-            "options": _image_options(),
-            "tooltip": "Image file from ComfyUI's input folder.",
-        }
-        if hasattr(io, "UploadType"):
-            image_input_kwargs["upload"] = io.UploadType.image
-        if hasattr(io, "FolderType"):
-            image_input_kwargs["image_folder"] = io.FolderType.input
-
         return io.Schema(
             node_id="HYBS_LoadImagePromptMetadata",
             display_name="Load Image Prompt Metadata",
@@ -281,7 +673,7 @@ class HYBS_LoadImagePromptMetadata(io.ComfyNode):
             search_aliases=["load image", "metadata", "workflow", "prompt", "positive", "negative"],
             essentials_category="Input/Image",
             inputs=[
-                io.Combo.Input("image", **image_input_kwargs),
+                _image_input(),
                 io.String.Input(
                     "positive_node_id",
                     default="",
@@ -292,6 +684,7 @@ class HYBS_LoadImagePromptMetadata(io.ComfyNode):
                     default="",
                     tooltip="Node ID to read as the negative prompt. Subgraph IDs like 82:78 are also supported.",
                 ),
+                _decode_image_input(),
             ],
             outputs=[
                 io.Image.Output(display_name="IMAGE"),
@@ -313,31 +706,17 @@ class HYBS_LoadImagePromptMetadata(io.ComfyNode):
         return True
 
     @classmethod
-    def execute(cls, image: str, positive_node_id: str, negative_node_id: str) -> io.NodeOutput:
+    def execute(
+        cls,
+        image: str,
+        positive_node_id: str,
+        negative_node_id: str,
+        decode_image: bool = True,
+    ) -> io.NodeOutput:
         image_path = _get_annotated_path(image)
-
-        try:
-            with node_helpers.pillow(Image.open, image_path) as img:
-                metadata = _extract_image_metadata(img)
-                workflow = _find_workflow(metadata)
-                prompt = _find_prompt(metadata)
-                output_image = _load_image_tensor(img)
-        except UnidentifiedImageError as exc:
-            raise ValueError(f"Could not load image: {image}") from exc
-
-        if workflow is None and prompt is None:
-            raise ValueError(f"No ComfyUI workflow or prompt metadata found in {image!r}")
-
-        positive = _prompt_from_id(workflow, prompt, positive_node_id)
-        negative = _prompt_from_id(workflow, prompt, negative_node_id)
-        missing = []
-        if not positive:
-            missing.append(f"positive node ID {positive_node_id!r}")
-        if not negative:
-            missing.append(f"negative node ID {negative_node_id!r}")
-        if missing:
-            raise ValueError(f"Could not extract prompt text for: {', '.join(missing)}")
-
+        parsed = _load_parsed_metadata(image_path, image)
+        positive, negative = _positive_negative(parsed, positive_node_id, negative_node_id)
+        output_image = _maybe_decode_image(image_path, image, decode_image)
         return io.NodeOutput(output_image, positive, negative)
 
     @classmethod
@@ -350,37 +729,20 @@ class HYBS_LoadImagePromptMetadata(io.ComfyNode):
         return f"{image}:{mtime}"
 
 
+def _coerce_node_ids(values: list) -> list[str]:
+    normalized = (_normalize_node_id(value) for value in values)
+    return [node_id for node_id in normalized if node_id]
+
+
 class HYBS_LoadImagePromptMetadataAdvance(io.ComfyNode):
     """Load an image and return any number of prompt strings by node ID."""
 
     @classmethod
     def _parse_selection(cls, selection) -> list[str]:
-        if isinstance(selection, dict):
-            values = selection.get("selected", [])
-        elif isinstance(selection, str):
-            try:
-                values = json.loads(selection)
-            except json.JSONDecodeError:
-                values = []
-        else:
-            values = []
-
-        if not isinstance(values, list):
-            return []
-
-        return [_normalize_node_id(value) for value in values if _normalize_node_id(value)]
+        return parse_selection(selection, _coerce_node_ids)
 
     @classmethod
     def define_schema(cls) -> io.Schema:
-        image_input_kwargs = {
-            "options": _image_options(),
-            "tooltip": "Image file from ComfyUI's input folder.",
-        }
-        if hasattr(io, "UploadType"):
-            image_input_kwargs["upload"] = io.UploadType.image
-        if hasattr(io, "FolderType"):
-            image_input_kwargs["image_folder"] = io.FolderType.input
-
         return io.Schema(
             node_id="HYBS_LoadImagePromptMetadataAdvance",
             display_name="Load Image Prompt Metadata Advance",
@@ -388,13 +750,14 @@ class HYBS_LoadImagePromptMetadataAdvance(io.ComfyNode):
             search_aliases=["load image", "metadata", "workflow", "prompt", "node id", "advanced"],
             essentials_category="Input/Image",
             inputs=[
-                io.Combo.Input("image", **image_input_kwargs),
+                _image_input(),
                 io.String.Input(
                     "selection",
                     default="[]",
                     socketless=True,
                     tooltip="Internal prompt node ID list managed by the frontend widget.",
                 ),
+                _decode_image_input(),
             ],
             outputs=[
                 io.Image.Output(display_name="IMAGE"),
@@ -412,15 +775,16 @@ class HYBS_LoadImagePromptMetadataAdvance(io.ComfyNode):
         if base_validation is not True:
             return base_validation
 
-        if not cls._parse_selection(selection):
+        node_ids = cls._parse_selection(selection)
+        if not node_ids:
             return "At least one prompt node ID is required."
-        if len(cls._parse_selection(selection)) > ADVANCED_MAX_PROMPTS:
+        if len(node_ids) > ADVANCED_MAX_PROMPTS:
             return f"Prompt node IDs must be {ADVANCED_MAX_PROMPTS} or fewer."
 
         return True
 
     @classmethod
-    def execute(cls, image: str, selection="[]") -> io.NodeOutput:
+    def execute(cls, image: str, selection="[]", decode_image: bool = True) -> io.NodeOutput:
         node_ids = cls._parse_selection(selection)
         if not node_ids:
             raise ValueError("At least one prompt node ID is required.")
@@ -428,23 +792,12 @@ class HYBS_LoadImagePromptMetadataAdvance(io.ComfyNode):
             raise ValueError(f"Prompt node IDs must be {ADVANCED_MAX_PROMPTS} or fewer.")
 
         image_path = _get_annotated_path(image)
-
-        try:
-            with node_helpers.pillow(Image.open, image_path) as img:
-                metadata = _extract_image_metadata(img)
-                workflow = _find_workflow(metadata)
-                prompt = _find_prompt(metadata)
-                output_image = _load_image_tensor(img)
-        except UnidentifiedImageError as exc:
-            raise ValueError(f"Could not load image: {image}") from exc
-
-        if workflow is None and prompt is None:
-            raise ValueError(f"No ComfyUI workflow or prompt metadata found in {image!r}")
+        parsed = _load_parsed_metadata(image_path, image)
 
         prompts = []
         missing = []
         for node_id in node_ids:
-            prompt_text = _prompt_from_id(workflow, prompt, node_id)
+            prompt_text = parsed.prompt_for(node_id)
             if prompt_text:
                 prompts.append(prompt_text)
             else:
@@ -457,8 +810,196 @@ class HYBS_LoadImagePromptMetadataAdvance(io.ComfyNode):
         prompt_outputs = prompts[:ADVANCED_MAX_PROMPTS]
         prompt_outputs.extend([""] * (ADVANCED_MAX_PROMPTS - len(prompt_outputs)))
 
+        output_image = _maybe_decode_image(image_path, image, decode_image)
         return io.NodeOutput(output_image, *prompt_outputs)
 
     @classmethod
     def fingerprint_inputs(cls, image=None, **kwargs) -> str:
         return HYBS_LoadImagePromptMetadata.fingerprint_inputs(image=image, **kwargs)
+
+
+class HYBS_LoadImagePromptText(io.ComfyNode):
+    """Return prompt strings from image metadata without decoding pixels."""
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="HYBS_LoadImagePromptText",
+            display_name="Load Image Prompt Text",
+            category="HYBS/LoadImage",
+            search_aliases=["image prompt", "metadata only", "prompt text", "positive", "negative"],
+            essentials_category="Input/Image",
+            inputs=[
+                _image_input(),
+                io.String.Input(
+                    "positive_node_id",
+                    default="",
+                    tooltip="Node ID to read as the positive prompt. Subgraph IDs like 82:78 are also supported.",
+                ),
+                io.String.Input(
+                    "negative_node_id",
+                    default="",
+                    tooltip="Node ID to read as the negative prompt. Subgraph IDs like 82:78 are also supported.",
+                ),
+            ],
+            outputs=[
+                io.String.Output(display_name="positive"),
+                io.String.Output(display_name="negative"),
+            ],
+            description="Extract positive/negative prompts from embedded ComfyUI workflow metadata by node ID "
+                        "without decoding the image pixels.",
+        )
+
+    @classmethod
+    def validate_inputs(cls, image: str, **kwargs) -> bool | str:
+        return HYBS_LoadImagePromptMetadata.validate_inputs(image=image)
+
+    @classmethod
+    def execute(cls, image: str, positive_node_id: str, negative_node_id: str) -> io.NodeOutput:
+        parsed = _load_parsed_metadata(_get_annotated_path(image), image)
+        positive, negative = _positive_negative(parsed, positive_node_id, negative_node_id)
+        return io.NodeOutput(positive, negative)
+
+    @classmethod
+    def fingerprint_inputs(cls, image=None, **kwargs) -> str:
+        return HYBS_LoadImagePromptMetadata.fingerprint_inputs(image=image, **kwargs)
+
+
+def _batch_folder(folder: str) -> str:
+    input_dir = os.path.realpath(folder_paths.get_input_directory())
+    path = os.path.realpath(os.path.join(input_dir, (folder or "").strip()))
+    if os.path.commonpath([input_dir, path]) != input_dir:
+        raise ValueError(f"Folder must be inside the input directory: {folder!r}")
+    if not os.path.isdir(path):
+        raise ValueError(f"Folder not found: {folder!r}")
+    return path
+
+
+def _batch_files(directory: str, pattern: str) -> list[str]:
+    pattern = (pattern or "*").strip() or "*"
+    return [name for name in DIRECTORY_INDEX.files(directory) if fnmatch.fnmatch(name, pattern)]
+
+
+class HYBS_LoadImagePromptMetadataBatch(io.ComfyNode):
+    """Extract positive/negative prompts from every matching image in an input subfolder."""
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="HYBS_LoadImagePromptMetadataBatch",
+            display_name="Load Image Prompt Metadata (Batch)",
+            category="HYBS/LoadImage",
+            search_aliases=["batch metadata", "folder prompts", "prompt list", "requeue prompts"],
+            essentials_category="Input/Image",
+            inputs=[
+                io.String.Input(
+                    "folder",
+                    default="",
+                    tooltip="Folder relative to ComfyUI's input folder. Empty means the input folder itself.",
+                ),
+                io.String.Input(
+                    "pattern",
+                    default="*.png",
+                    tooltip="Filename glob, e.g. *.png or ComfyUI_*.webp.",
+                ),
+                io.String.Input(
+                    "positive_node_id",
+                    default="",
+                    tooltip="Node ID to read as the positive prompt. Subgraph IDs like 82:78 are also supported.",
+                ),
+                io.String.Input(
+                    "negative_node_id",
+                    default="",
+                    tooltip="Node ID to read as the negative prompt. Subgraph IDs like 82:78 are also supported.",
+                ),
+                io.Boolean.Input(
+                    "decode_images",
+                    default=False,
+                    tooltip="Also decode pixels for the images output. Leave off when only prompts are needed; images is then an empty list.",
+                ),
+            ],
+            outputs=[
+                io.String.Output(display_name="positive", is_output_list=True),
+                io.String.Output(display_name="negative", is_output_list=True),
+                io.String.Output(display_name="paths", is_output_list=True),
+                io.Image.Output(display_name="images", is_output_list=True),
+                io.Int.Output(display_name="count"),
+            ],
+            description="Extract positive/negative prompts from all images in an input subfolder matching a glob. "
+                        "Files are parsed on a bounded thread pool; pixels are decoded only when enabled.",
+        )
+
+    @classmethod
+    def validate_inputs(cls, folder="", **kwargs) -> bool | str:
+        try:
+            _batch_folder(folder)
+        except ValueError as e:
+            return str(e)
+        return True
+
+    @staticmethod
+    def _load_one(path: str, positive_node_id: str, negative_node_id: str, decode_images: bool):
+        name = os.path.basename(path)
+        # Bypass the interactive metadata cache so a large batch does not evict it.
+        metadata = _read_metadata_only(path, name)
+        parsed = _ParsedMetadata(_find_workflow(metadata), _find_prompt(metadata))
+        if parsed.empty:
+            raise ValueError(f"No ComfyUI workflow or prompt metadata found in {name!r}")
+        positive, negative = _positive_negative(parsed, positive_node_id, negative_node_id)
+        image = _decode_image(path, name) if decode_images else None
+        return positive, negative, image
+
+    @classmethod
+    def execute(
+        cls,
+        folder: str,
+        pattern: str,
+        positive_node_id: str,
+        negative_node_id: str,
+        decode_images: bool = False,
+    ) -> io.NodeOutput:
+        directory = _batch_folder(folder)
+        paths = [os.path.join(directory, name) for name in _batch_files(directory, pattern)]
+        if not paths:
+            raise ValueError(f"No files match {pattern!r} in {folder or 'input'!r}")
+
+        def load(path):
+            try:
+                return cls._load_one(path, positive_node_id, negative_node_id, decode_images)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(paths))) as pool:
+            results = list(pool.map(load, paths))
+
+        positives, negatives, found_paths, images = [], [], [], []
+        skipped = 0
+        for path, result in zip(paths, results):
+            if isinstance(result, Exception):
+                skipped += 1
+                LOGGER.warning("Skipped %s: %s", os.path.basename(path), result)
+                continue
+            positive, negative, image = result
+            positives.append(positive)
+            negatives.append(negative)
+            found_paths.append(path)
+            if decode_images:
+                images.append(image)
+
+        if not found_paths:
+            raise ValueError(f"No prompt metadata could be extracted from {len(paths)} file(s)")
+
+        LOGGER.info("Extracted prompts from %d file(s), skipped %d", len(found_paths), skipped)
+        return io.NodeOutput(positives, negatives, found_paths, images, len(found_paths))
+
+    @classmethod
+    def fingerprint_inputs(cls, folder="", pattern="*.png", **kwargs) -> str:
+        try:
+            directory = _batch_folder(folder)
+            digest = hashlib.sha1()
+            for name in _batch_files(directory, pattern):
+                st = os.stat(os.path.join(directory, name))
+                digest.update(f"{name}:{st.st_mtime_ns}:{st.st_size};".encode())
+            return f"{folder}:{pattern}:{digest.hexdigest()}"
+        except Exception:
+            return f"{folder}:{pattern}:0"
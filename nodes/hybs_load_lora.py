@@ -4,24 +4,16 @@ from __future__ import annotations
 
 import os
 
-import comfy.utils as utils
-import folder_paths
-
 from ..hybs_comfy_api import io
+from ..hybs_logging import get_logger
+from ..hybs_lora_cache import load_lora_state_dict
+from ..hybs_model_index import MODEL_INDEX
+from ..hybs_options import model_folder_options
 
-try:
-    from comfy import sd
-except Exception:
-    sd = None
-
-LOG_PREFIX = '[HYBS]["Load LoRA"]'
+LOGGER = get_logger("Load LoRA")
 NONE_OPTION = "NONE"
 
 
-def _log(message: str) -> None:
-    print(f"{LOG_PREFIX} {message}")
-
-
 def _resolve_type(name: str):
     t = getattr(io, name, None)
     if t is not None:
@@ -37,20 +29,36 @@ _Model = _resolve_type("Model")
 _CLIP = _resolve_type("CLIP")
 
 
-def _lora_options() -> list[str]:
-    return [NONE_OPTION, *folder_paths.get_filename_list("loras")]
+_LORA_OPTIONS = model_folder_options("load_lora", "loras", prefix=(NONE_OPTION,))
 
 
 def _is_none_lora(lora_name) -> bool:
     return lora_name is None or str(lora_name).strip() in ("", NONE_OPTION)
 
 
+def _comfy_sd():
+    """comfy.sd, imported on the first LoRA application instead of at extension load."""
+    try:
+        from comfy import sd
+    except Exception:
+        return None
+    return sd
+
+
 def _apply_lora(model, clip, lora_path: str, lora_name: str, sm: float, sc: float):
+    sd = _comfy_sd()
+    if sd is not None and hasattr(sd, "load_lora_for_models"):
+        try:
+            lora = load_lora_state_dict(lora_path)
+            return (*sd.load_lora_for_models(model, clip, lora, sm, sc), True)
+        except Exception as e:
+            LOGGER.warning("comfy.sd.load_lora_for_models failed: %s", e)
+
     if sd is not None and hasattr(sd, "load_lora"):
         try:
             return (*sd.load_lora(model, clip, lora_path, sm, sc), True)
         except Exception as e:
-            _log(f"comfy.sd.load_lora failed: {e}")
+            LOGGER.warning("comfy.sd.load_lora failed: %s", e)
 
     try:
         from nodes import LoraLoader as _BuiltinLoraLoader
@@ -58,19 +66,21 @@ def _apply_lora(model, clip, lora_path: str, lora_name: str, sm: float, sc: floa
         try:
             return (*_BuiltinLoraLoader().load_lora(model, clip, lora_name, sm, sc), True)
         except Exception as e:
-            _log(f"nodes.LoraLoader failed: {e}")
+            LOGGER.warning("nodes.LoraLoader failed: %s", e)
     except Exception:
         pass
 
     try:
-        lora = utils.load_torch_file(lora_path, safe_load=True)
+        import comfy.utils as utils
+
+        lora = load_lora_state_dict(lora_path)
         if hasattr(utils, "apply_lora"):
             model = utils.apply_lora(model, lora, sm)
             if clip is not None and sc != 0.0 and hasattr(utils, "apply_lora_to_clip"):
                 clip = utils.apply_lora_to_clip(clip, lora, sc)
             return model, clip, True
     except Exception as e:
-        _log(f"fallback apply_lora failed: {e}")
+        LOGGER.warning("fallback apply_lora failed: %s", e)
 
     return model, clip, False
 
@@ -91,7 +101,7 @@ class HYBS_LoadLoRA(io.ComfyNode):
                 _CLIP.Input("clip"),
                 io.Combo.Input(
                     "lora_name",
-                    options=_lora_options(),
+                    options=_LORA_OPTIONS.options(),
                     default=NONE_OPTION,
                     tooltip="LoRA filename. NONE means no LoRA is applied.",
                 ),
@@ -124,7 +134,7 @@ class HYBS_LoadLoRA(io.ComfyNode):
     def validate_inputs(cls, lora_name=NONE_OPTION, **kwargs) -> bool | str:
         if _is_none_lora(lora_name):
             return True
-        if lora_name not in folder_paths.get_filename_list("loras"):
+        if not MODEL_INDEX.contains("loras", lora_name):
             return f"Unknown LoRA: {lora_name}"
         return True
 
@@ -139,12 +149,12 @@ class HYBS_LoadLoRA(io.ComfyNode):
         **kwargs,
     ) -> io.NodeOutput:
         if _is_none_lora(lora_name):
-            _log("No LoRA selected (passthrough)")
+            LOGGER.info("No LoRA selected (passthrough)")
             return io.NodeOutput(model, clip, "")
 
         sm = float(strength_model)
         sc = float(strength_clip)
-        lora_path = folder_paths.get_full_path("loras", lora_name)
+        lora_path = MODEL_INDEX.full_path("loras", lora_name)
         if not lora_path:
             raise FileNotFoundError(f"LoRA not found: {lora_name}")
 
@@ -155,5 +165,5 @@ class HYBS_LoadLoRA(io.ComfyNode):
         base = os.path.basename(lora_name)
         stem, _ = os.path.splitext(base)
         token = f"<lora:{stem}:{sm}:{sc}>"
-        _log(f"Applied LoRA: {lora_name} (m={sm}, c={sc})")
+        LOGGER.info("Applied LoRA: %s (m=%s, c=%s)", lora_name, sm, sc)
         return io.NodeOutput(new_model, new_clip, token)
@@ -1,16 +1,35 @@
 """LoRA list node."""
 
-import json
-import folder_paths
-
 from ..hybs_comfy_api import io
+from ..hybs_logging import get_logger
+from ..hybs_model_index import MODEL_INDEX
+from ..hybs_options import model_folder_options
+from ..hybs_selection import parse_selection
 
-LOG_PREFIX = '[HYBS]["LoRA List"]'
+LOGGER = get_logger("LoRA List")
 NONE_OPTION = "NONE"
+_LORA_OPTIONS = model_folder_options("lora_list", "loras")
+
+
+def _coerce_lora_names(values: list) -> list[str | None]:
+    parsed = []
+    for value in values:
+        if value is None:
+            name = None
+        elif isinstance(value, str):
+            name = value.strip()
+        elif isinstance(value, dict):
+            raw_name = value.get("name")
+            name = None if raw_name is None else str(raw_name).strip()
+        else:
+            continue
+
+        if name == "":
+            continue
 
+        parsed.append(name)
 
-def _log(message: str) -> None:
-    print(f"{LOG_PREFIX} {message}")
+    return parsed
 
 
 class HYBS_LoRAList(io.ComfyNode):
@@ -18,41 +37,11 @@ class HYBS_LoRAList(io.ComfyNode):
 
     @classmethod
     def _lora_options(cls) -> list[str]:
-        return folder_paths.get_filename_list("loras")
+        return _LORA_OPTIONS.options()
 
     @classmethod
     def _parse_selection(cls, selection) -> list[str | None]:
-        if isinstance(selection, dict):
-            values = selection.get("selected", [])
-        elif isinstance(selection, str):
-            try:
-                values = json.loads(selection)
-            except json.JSONDecodeError:
-                values = []
-        else:
-            values = []
-
-        if not isinstance(values, list):
-            return []
-
-        parsed = []
-        for value in values:
-            if value is None:
-                name = None
-            elif isinstance(value, str):
-                name = value.strip()
-            elif isinstance(value, dict):
-                raw_name = value.get("name")
-                name = None if raw_name is None else str(raw_name).strip()
-            else:
-                continue
-
-            if name == "":
-                continue
-
-            parsed.append(name)
-
-        return parsed
+        return parse_selection(selection, _coerce_lora_names)
 
     @classmethod
     def define_schema(cls) -> io.Schema:
@@ -84,12 +73,10 @@ class HYBS_LoRAList(io.ComfyNode):
         if not selected:
             return "At least one LoRA entry is required."
 
-        available = set(folder_paths.get_filename_list("loras"))
-        missing = [
-            name
-            for name in selected
-            if name is not None and name != NONE_OPTION and name not in available
-        ]
+        missing = MODEL_INDEX.missing(
+            "loras",
+            (name for name in selected if name is not None and name != NONE_OPTION),
+        )
         if missing:
             return f"Unknown LoRAs: {', '.join(missing)}"
 
@@ -115,5 +102,5 @@ class HYBS_LoRAList(io.ComfyNode):
             raise ValueError("NONE is only allowed in the first LoRA row.")
 
         normalized = [None if name == NONE_OPTION else name for name in selected]
-        _log(f"Selected {len(normalized)} LoRA entries")
+        LOGGER.info("Selected %d LoRA entries", len(normalized))
         return io.NodeOutput(normalized, len(normalized))
@@ -1,7 +1,7 @@
 """Random resolution selector node."""
 
 from ..hybs_comfy_api import io
-from ..hybs_resolution_common import load_resolution_combos, get_resolution_config_mtime
+from ..hybs_resolution_common import ORIENTATIONS, load_resolution_table, get_resolution_config_mtime
 
 
 class HYBS_RandomResolutionSelector(io.ComfyNode):
@@ -15,20 +15,39 @@ class HYBS_RandomResolutionSelector(io.ComfyNode):
             category="HYBS/ResolutionSelector",
             search_aliases=["random resolution", "size by seed", "deterministic size"],
             essentials_category="Utilities/Resolution",
-            inputs=[io.Int.Input("seed", default=0, min=0, tooltip="Deterministic pick: index = seed % len(combos)")],
+            inputs=[
+                io.Int.Input(
+                    "seed",
+                    default=0,
+                    min=0,
+                    tooltip="Deterministic pick: index = seed % len(combos), or a seeded weighted draw when combos have different weights",
+                ),
+                io.String.Input("tag", default="", tooltip="Only use combos with this tag (empty = all)."),
+                io.Combo.Input("orientation", options=list(ORIENTATIONS), default="any"),
+                io.Float.Input("min_megapixels", default=0.0, min=0.0, step=0.01, tooltip="Minimum width*height in megapixels."),
+                io.Float.Input("max_megapixels", default=0.0, min=0.0, step=0.01, tooltip="Maximum width*height in megapixels (0 = no limit)."),
+            ],
             outputs=[io.Int.Output(display_name="width"), io.Int.Output(display_name="height")],
-            description="Selects a (width, height) from a list based on seed. Reloads JSON on every execution."
+            description="Selects a (width, height) from a list based on seed, optionally weighted and filtered. Reloads JSON when the file changes."
         )
 
     @classmethod
-    def execute(cls, seed: int) -> io.NodeOutput:
-        combos = load_resolution_combos()  # Reload every execution.
-        idx = seed % len(combos)
-        w, h = combos[idx]
+    def execute(
+        cls,
+        seed: int,
+        tag: str = "",
+        orientation: str = "any",
+        min_megapixels: float = 0.0,
+        max_megapixels: float = 0.0,
+    ) -> io.NodeOutput:
+        table = load_resolution_table()  # Cached until the JSON changes.
+        sampler = table.sampler(tag, orientation, min_megapixels, max_megapixels)  # Memoized per filter.
+        w, h = sampler.pick(seed)
         return io.NodeOutput(w, h)
 
     @classmethod
-    def fingerprint_inputs(cls, seed: int = 0, **kwargs) -> str:
+    def fingerprint_inputs(cls, seed: int = 0, tag: str = "", orientation: str = "any",
+                           min_megapixels: float = 0.0, max_megapixels: float = 0.0, **kwargs) -> str:
         # Re-run when JSON changes by including its mtime.
         mtime = get_resolution_config_mtime()
-        return f"{seed}:{mtime}"
+        return f"{seed}:{tag}:{orientation}:{min_megapixels}:{max_megapixels}:{mtime}"
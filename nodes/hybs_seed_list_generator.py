@@ -1,11 +1,106 @@
 """Seed list generator node."""
 
-import random
+from __future__ import annotations
+
+import array
+import secrets
 import uuid
+from typing import TYPE_CHECKING
 
 from ..hybs_comfy_api import io
 
+if TYPE_CHECKING:
+    import numpy as np
+
 MAX_SEED = 2**32 - 1
+FEISTEL_ROUNDS = 4
+# Seeds permuted per NumPy pass; bounds temporaries to a few MB.
+SEED_CHUNK = 1 << 20
+SEED_TYPECODE = "I" if array.array("I").itemsize == 4 else "L"
+
+
+def _round_keys(seed: int | None) -> list[int]:
+    if seed is None:
+        return [secrets.randbits(32) for _ in range(FEISTEL_ROUNDS)]
+    # SplitMix-style expansion keeps reproducible keys independent of Python's RNG.
+    keys = []
+    state = int(seed) & 0xFFFFFFFFFFFFFFFF
+    for _ in range(FEISTEL_ROUNDS):
+        state = (state + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        z = state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        keys.append((z ^ (z >> 31)) & 0xFFFFFFFF)
+    return keys
+
+
+def _feistel_permute(values: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """
+    Keyed bijection on 32-bit integers.
+
+    A balanced Feistel network is a permutation for any round function, so
+    distinct inputs always map to distinct seeds.
+    """
+    import numpy as np
+
+    left = values >> np.uint32(16)
+    right = values & np.uint32(0xFFFF)
+    for key in keys:
+        mixed = (right ^ key) * np.uint32(0x045D9F3B)
+        mixed ^= mixed >> np.uint32(16)
+        mixed = (mixed * np.uint32(0x045D9F3B)) & np.uint32(0xFFFF)
+        left, right = right, left ^ mixed
+    return (left << np.uint32(16)) | right
+
+
+def generate_seeds(count: int, seed: int | None = None, start: int = 0) -> array.array:
+    """
+    Return ``count`` unique 32-bit seeds as a compact ``array.array``.
+
+    Seeds are positions ``start .. start + count - 1`` of a keyed permutation
+    of the whole 32-bit range, so memory is 4 bytes per seed and nothing is
+    sampled or de-duplicated. The same ``seed`` always yields the same order.
+    """
+    count = int(count)
+    start = int(start)
+    if count < 0 or start < 0 or start + count > MAX_SEED + 1:
+        raise ValueError(f"Seed range {start}..{start + count} is outside 0..{MAX_SEED + 1}")
+
+    import numpy as np
+
+    keys = np.array(_round_keys(seed), dtype=np.uint32)
+    seeds = array.array(SEED_TYPECODE)
+    for offset in range(start, start + count, SEED_CHUNK):
+        stop = min(offset + SEED_CHUNK, start + count)
+        block = np.arange(offset, stop, dtype=np.uint64).astype(np.uint32)
+        seeds.frombytes(_feistel_permute(block, keys).tobytes())
+    return seeds
+
+
+def _page_input():
+    # Fixed by default so the same key and count keep producing the same list;
+    # switch the control to "increment" to step through a paged sweep.
+    kwargs = {}
+    if hasattr(getattr(io, "ControlAfterGenerate", None), "fixed"):
+        kwargs["control_after_generate"] = io.ControlAfterGenerate.fixed
+    return io.Int.Input(
+        "page",
+        default=0,
+        min=0,
+        max=MAX_SEED,
+        tooltip="Chunk index for paged sweeps: seeds page*count .. page*count+count-1 of the reproducible permutation. Set the control to increment to advance one page per queue. Ignored when reproducible is off.",
+        **kwargs,
+    )
+
+
+def _page_range(count: int, page: int) -> tuple[int, int]:
+    """Return (offset, size) of a page; the last page is truncated to the seed space."""
+    if int(count) < 1:
+        raise ValueError(f"count must be at least 1, got {count}")
+    offset = int(page) * int(count)
+    if offset > MAX_SEED:
+        raise ValueError(f"Page {page} starts past the end of the 32-bit seed space")
+    return offset, min(int(count), MAX_SEED + 1 - offset)
 
 
 class HYBS_SeedListGenerator(io.ComfyNode):
@@ -21,20 +116,51 @@ class HYBS_SeedListGenerator(io.ComfyNode):
             essentials_category="Utilities/Seed",
             inputs=[
                 io.Int.Input("count", default=1, min=1, max=MAX_SEED + 1),
+                io.Boolean.Input(
+                    "reproducible",
+                    default=False,
+                    tooltip="Derive the list from key instead of fresh randomness; the same key and count give the same list.",
+                ),
+                io.Int.Input(
+                    "key",
+                    default=0,
+                    min=0,
+                    max=MAX_SEED,
+                    tooltip="Key for reproducible mode. Ignored when reproducible is off.",
+                ),
+                _page_input(),
             ],
             outputs=[
                 io.Custom("LIST").Output(display_name="seed list"),
                 io.Int.Output(display_name="count"),
+                io.Int.Output(display_name="offset"),
             ],
             description="Generate a list of random seed values."
         )
 
     @classmethod
-    def execute(cls, count: int) -> io.NodeOutput:
-        count = int(count)
-        seeds = random.sample(range(MAX_SEED + 1), count)
-        return io.NodeOutput(seeds, count)
+    def validate_inputs(cls, **kwargs) -> bool | str:
+        # Inputs are read from kwargs: naming them here would switch off
+        # ComfyUI's own min/max checks for count and page.
+        count = kwargs.get("count", 1)
+        page = kwargs.get("page", 0) if kwargs.get("reproducible", False) else 0
+        if count is None or page is None:
+            return True  # linked inputs are checked once their values exist
+        try:
+            _page_range(count, page)
+        except (TypeError, ValueError) as e:
+            return str(e)
+        return True
+
+    @classmethod
+    def execute(cls, count: int, reproducible: bool = False, key: int = 0, page: int = 0) -> io.NodeOutput:
+        # Pages only mean something over a fixed permutation; fresh keys ignore them.
+        offset, size = _page_range(count, page if reproducible else 0)
+        seeds = generate_seeds(size, seed=int(key) if reproducible else None, start=offset)
+        return io.NodeOutput(seeds, size, offset)
 
     @classmethod
-    def fingerprint_inputs(cls, **kwargs) -> str:
+    def fingerprint_inputs(cls, count=1, reproducible=False, key=0, page=0, **kwargs) -> str:
+        if reproducible:
+            return f"{count}:{key}:{page}"
         return uuid.uuid4().hex
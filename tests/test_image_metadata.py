@@ -0,0 +1,61 @@
+"""The streaming PNG reader must find prompt/workflow text on either side of IDAT."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+from benchmarks import comfy_stubs
+
+comfy_stubs.install(tempfile.gettempdir())
+metadata_mod = comfy_stubs.load("nodes.hybs_load_image_prompt_metadata")
+
+PROMPT = json.dumps({"1": {"class_type": "CLIPTextEncode", "inputs": {"text": "a cat"}}})
+WORKFLOW = json.dumps({"nodes": [{"id": 1, "type": "CLIPTextEncode", "widgets_values": ["a cat"]}]})
+
+
+def _chunk(chunk_type: bytes, body: bytes) -> bytes:
+    return struct.pack(">I4s", len(body), chunk_type) + body + struct.pack(">I", zlib.crc32(chunk_type + body))
+
+
+def _text(key: str, value: str) -> bytes:
+    return _chunk(b"tEXt", key.encode("latin-1") + b"\x00" + value.encode("latin-1"))
+
+
+def _png(before: list[bytes], after: list[bytes]) -> bytes:
+    ihdr = _chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0))
+    idat = _chunk(b"IDAT", zlib.compress(b"\x00\x00"))
+    return metadata_mod.PNG_SIGNATURE + ihdr + b"".join(before) + idat + b"".join(after) + _chunk(b"IEND", b"")
+
+
+class PngMetadataTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def read(self, data: bytes) -> dict:
+        path = os.path.join(self.directory.name, "image.png")
+        with open(path, "wb") as fp:
+            fp.write(data)
+        return metadata_mod._read_metadata_only(path, "image.png")
+
+    def test_workflow_after_idat(self):
+        metadata = self.read(_png([_text("prompt", PROMPT)], [_text("workflow", WORKFLOW)]))
+        self.assertEqual(metadata, {"prompt": PROMPT, "workflow": WORKFLOW})
+
+    def test_all_text_after_idat(self):
+        metadata = self.read(_png([], [_text("workflow", WORKFLOW), _text("prompt", PROMPT)]))
+        self.assertEqual(metadata, {"workflow": WORKFLOW, "prompt": PROMPT})
+
+    def test_stops_at_idat_once_complete(self):
+        before = [_text("prompt", PROMPT), _text("workflow", WORKFLOW)]
+        metadata = self.read(_png(before, [_text("prompt", "{}")]))
+        self.assertEqual(metadata["prompt"], PROMPT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""CompiledRuleSet.match must agree with a plain per-rule re.search.
+
+The literal prefilter reads CPython's private regex parser, so a parser
+change in a new Python release shows up here instead of as silently
+dropped LoRAs. Run with ``python -m unittest discover tests``.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import tempfile
+import unittest
+
+from benchmarks import comfy_stubs
+
+comfy_stubs.install(tempfile.gettempdir())
+rules_mod = comfy_stubs.load("hybs_lora_rules")
+
+TRIGGERS = [
+    r"red\s+dress",
+    r"(?i)red\s+dress",
+    r"\bblue_hair\b",
+    r"^masterpiece",
+    r"best quality$",
+    r"(?:cat|dog)_ears",
+    r"(?i)(?:CAT|fox)tail",
+    r"smile|grin|laugh(?:ing)?",
+    r"(?:ab)+cd",
+    r"x{2,}yz",
+    r"(?:opt)?ional",
+    r"w*ord",
+    r"(?i:mixed)Case",
+    r"Mixed(?i:case)",
+    r"(?i)straße",
+    r"(?i)kelvin",
+    r"(?i)ǆemal",
+    r"(?i)σίσυφος",
+    r"ÉCOLE",
+    r"(?i)école",
+    r"[a-c]at_hat",
+    r"no(?=thing)",
+    r"(?<!un)happy",
+    r"(?i)\btag1\d\b",
+    r"tag(?:2|3)_v\d",
+    r"(",  # invalid regex: never matches
+    r"",  # empty trigger: never matches
+    r"(?s)line.break",
+    r"(?m)^second",
+]
+
+WORDS = [
+    "red dress", "RED  Dress", "blue_hair", "xblue_hair", "masterpiece", "best quality",
+    "cat_ears", "dog_ears", "CATtail", "foxTail", "smile", "laughing", "ababcd", "acd",
+    "xxxyz", "xyz", "ional", "optional", "wwword", "ord", "MIXEDCase", "mixedcase",
+    "MixedCASE", "STRASSE", "strasse", "Straße", "Kelvin", "KELVIN", "ǅemal",
+    "ǄEMAL", "ΣΊΣΥΦΟΣ", "σίσυφοσ", "ÉCOLE", "école", "École", "bat_hat", "dat_hat",
+    "nothing", "nothin", "unhappy", "happy", "tag12", "TAG15", "tag2_v3", "tag3_vx",
+    "line\nbreak", "first\nsecond", "\n", ",", " ", "",
+]
+
+
+def _expected(rule_set, text: str) -> list[int]:
+    return [
+        rule.index
+        for rule in rule_set.rules
+        if rule.pattern is not None and re.search(rule.trigger, text) is not None
+    ]
+
+
+class CompiledRuleSetMatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        entries = [{"trigger": trigger, "name": f"lora_{i}"} for i, trigger in enumerate(TRIGGERS)]
+        cls.rule_set = rules_mod.CompiledRuleSet(entries)
+
+    def assertMatchesPlainSearch(self, text: str):
+        got = [rule.index for rule in self.rule_set.match(text)]
+        self.assertEqual(got, _expected(self.rule_set, text), msg=repr(text))
+
+    def test_prefilter_is_active(self):
+        self.assertTrue(self.rule_set._prefilters)
+
+    def test_single_words(self):
+        for word in WORDS:
+            self.assertMatchesPlainSearch(word)
+
+    def test_random_prompts(self):
+        rng = random.Random(20240601)
+        for _ in range(3000):
+            parts = rng.choices(WORDS, k=rng.randint(1, 8))
+            text = rng.choice([", ", " ", "", "\n"]).join(parts)
+            if rng.random() < 0.3:
+                text = text.upper() if rng.random() < 0.5 else text.swapcase()
+            self.assertMatchesPlainSearch(text)
+
+    def test_match_many_agrees_with_match(self):
+        texts = [", ".join(WORDS[i::7]) for i in range(7)] * 2
+        many = self.rule_set.match_many(texts)
+        self.assertEqual([list(m) for m in many], [self.rule_set.match(t) for t in texts])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""instrument_node must not change what ComfyUI sees of a node's methods.
+
+ComfyUI reads ``validate_inputs`` with ``inspect.getfullargspec`` and skips
+its own combo and range checks for the inputs named there, so a wrapper
+that hides the parameters changes validation results.
+"""
+
+from __future__ import annotations
+
+import inspect
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks import comfy_stubs
+
+comfy_stubs.install(tempfile.gettempdir())
+metrics_mod = comfy_stubs.load("hybs_metrics")
+
+NODE_MODULES = [
+    "nodes.hybs_diffusion_model_list",
+    "nodes.hybs_double_list",
+    "nodes.hybs_int_list",
+    "nodes.hybs_load_image_prompt_metadata",
+    "nodes.hybs_load_lora",
+    "nodes.hybs_lora_list",
+    "nodes.hybs_seed_list_generator",
+]
+
+
+def _node_classes():
+    for name in NODE_MODULES:
+        module = comfy_stubs.load(name)
+        for value in vars(module).values():
+            if isinstance(value, type) and value.__name__.startswith("HYBS_") and "execute" in vars(value):
+                yield value
+
+
+def _copy(cls: type) -> type:
+    attrs = {k: v for k, v in vars(cls).items() if k not in ("__dict__", "__weakref__")}
+    return type(cls.__name__, cls.__bases__, attrs)
+
+
+class InstrumentNodeTest(unittest.TestCase):
+    def test_argspecs_survive_wrapping(self):
+        classes = list(_node_classes())
+        self.assertTrue(classes)
+        with mock.patch.object(metrics_mod, "ENABLED", True):
+            for cls in classes:
+                wrapped = metrics_mod.instrument_node(_copy(cls))
+                self.assertTrue(wrapped._hybs_instrumented)
+                for method in metrics_mod.INSTRUMENTED_METHODS:
+                    if method not in vars(cls):
+                        continue
+                    with self.subTest(node=cls.__name__, method=method):
+                        self.assertIsNot(vars(wrapped)[method], vars(cls)[method])
+                        self.assertEqual(
+                            inspect.getfullargspec(getattr(wrapped, method)),
+                            inspect.getfullargspec(getattr(cls, method)),
+                        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -132,14 +132,56 @@ function queueInitialCompact(node) {
   setTimeout(compact, 300);
 }
 
+function isRangeSpec(value) {
+  return value !== null && typeof value === "object" && !Array.isArray(value);
+}
+
+function rangeSpecLength(spec) {
+  const range = spec.range;
+  if (Array.isArray(range) && (range.length === 2 || range.length === 3)) {
+    const start = Number(range[0]);
+    const stop = Number(range[1]);
+    const step = range.length === 3 ? Number(range[2]) : 1;
+    const steps = (stop - start) / step;
+    return step && Number.isFinite(steps) && steps >= 0 ? Math.floor(steps + 1e-9) + 1 : 0;
+  }
+  const points = spec.linspace ?? spec.logspace;
+  const num = Array.isArray(points) ? Number(points[2]) : NaN;
+  return Number.isInteger(num) && num >= 1 ? num : 0;
+}
+
+function mergeRangeSpecs(node, values) {
+  // Range specs from the saved selection keep their position; value rows fill the other slots.
+  const merged = [];
+  let valueIndex = 0;
+  for (const spec of node._hybsRangeSlots || []) {
+    if (spec) {
+      merged.push(spec);
+    } else if (valueIndex < values.length) {
+      merged.push(values[valueIndex]);
+      valueIndex += 1;
+    }
+  }
+  merged.push(...values.slice(valueIndex));
+  node._hybsRangeSlots = merged.map((value) => (isRangeSpec(value) ? value : null));
+  return merged;
+}
+
+function selectionLength(values) {
+  return values.reduce((total, value) => total + (isRangeSpec(value) ? rangeSpecLength(value) : 1), 0);
+}
+
 function getValues(node) {
   return findValueWidgets(node).map((widget) => Number(widget.value ?? 0));
 }
 
 function storeSelection(node, selectionWidget) {
-  const values = getValues(node).map((value) => (Number.isFinite(value) ? value : 0.0));
+  const values = mergeRangeSpecs(
+    node,
+    getValues(node).map((value) => (Number.isFinite(value) ? value : 0.0)),
+  );
   selectionWidget.value = JSON.stringify(values);
-  setCountWidget(node, values.length);
+  setCountWidget(node, selectionLength(values));
   return values;
 }
 
@@ -211,7 +253,10 @@ function refreshFromSelection(node, selectionWidget, mode = "preserve") {
     values = [1.0];
   }
 
-  values.forEach((value) => addValueWidget(node, selectionWidget, value));
+  node._hybsRangeSlots = values.map((value) => (isRangeSpec(value) ? value : null));
+  values
+    .filter((value) => !isRangeSpec(value))
+    .forEach((value) => addValueWidget(node, selectionWidget, value));
   addControlWidgets(node, selectionWidget);
   storeSelection(node, selectionWidget);
   applyNodeSize(node, mode, baseSize);